@@ -16,10 +16,11 @@ if str(scripts_dir) not in sys.path:
 from database import SessionLocal, init_db, engine
 from db_operations import (
     add_ingredient_type, get_or_create_ingredient_type,
-    add_ingredient,
+    add_ingredients_bulk,
     add_subtag, get_subtag,
-    add_tag,
-    add_recipe, get_recipe
+    add_tags_bulk,
+    add_recipe, get_recipe,
+    normalize_name
 )
 from models import Recipe, Article, Ingredient, Tag, IngredientType, Subtag
 from sqlalchemy import delete
@@ -162,8 +163,8 @@ def bootload_ingredients(db, ingredients_dir: Path):
         # Filename without .txt extension is the ingredient type
         type_name = file_path.stem
         
-        # Get or create ingredient type
-        ingredient_type = get_or_create_ingredient_type(db, type_name)
+        # Get or create ingredient type (committed with the ingredients once every file is loaded)
+        ingredient_type = get_or_create_ingredient_type(db, type_name, commit=False)
         if ingredient_type.id is None:
             total_types += 1
         
@@ -175,34 +176,35 @@ def bootload_ingredients(db, ingredients_dir: Path):
             continue
         
         print(f"\n  {type_name}:")
-        added_count = 0
-        skipped_count = 0
         
+        # Add the whole file in one batched INSERT (existing ingredients are skipped);
+        # the caller commits once after the last file
+        try:
+            created = add_ingredients_bulk(
+                db,
+                [{'name': ing_name, 'type_name': type_name} for ing_name in ingredient_names],
+                commit=False
+            )
+        except ValueError as e:
+            print(f"    ✗ {e}")
+            continue
+        except Exception as e:
+            print(f"    ✗ Unexpected error - {e}")
+            continue
+        
+        created_names = {ingredient.name for ingredient in created}
+        reported = set()
         for ing_name in ingredient_names:
-            try:
-                # Check if ingredient already exists
-                from db_operations import get_ingredient
-                existing = get_ingredient(db, name=ing_name)
-                if existing:
-                    print(f"    - {ing_name} (already exists, skipped)")
-                    skipped_count += 1
-                    continue
-                
-                # Add ingredient with type
-                ingredient = add_ingredient(
-                    db,
-                    name=ing_name,
-                    type_name=type_name
-                )
+            normalized_name, _ = normalize_name(ing_name)
+            if normalized_name in created_names and normalized_name not in reported:
                 print(f"    ✓ {ing_name}")
-                added_count += 1
-                total_ingredients += 1
-            except ValueError as e:
-                print(f"    ✗ {ing_name}: {e}")
-            except Exception as e:
-                print(f"    ✗ {ing_name}: Unexpected error - {e}")
+            else:
+                print(f"    - {ing_name} (already exists, skipped)")
+            reported.add(normalized_name)
         
-        print(f"    ({added_count} added, {skipped_count} skipped)")
+        added_count = len(created)
+        total_ingredients += added_count
+        print(f"    ({added_count} added, {len(ingredient_names) - added_count} skipped)")
     
     print(f"\n  Total: {total_ingredients} ingredients added across {len(ingredient_files)} types")
 
@@ -244,34 +246,31 @@ def bootload_tags(db, tags_dir: Path):
             continue
         
         print(f"\n  {subtag_name}:")
-        added_count = 0
-        skipped_count = 0
         
+        # Add the whole file in one batched INSERT (existing tags are skipped);
+        # the caller commits once after the last file
+        try:
+            created = add_tags_bulk(db, tag_names, subtag_name=subtag_name, commit=False)
+        except ValueError as e:
+            print(f"    ✗ {e}")
+            continue
+        except Exception as e:
+            print(f"    ✗ Unexpected error - {e}")
+            continue
+        
+        created_names = {tag.name for tag in created}
+        reported = set()
         for tag_name in tag_names:
-            try:
-                # Check if tag already exists
-                from db_operations import get_tag
-                existing = get_tag(db, name=tag_name)
-                if existing:
-                    print(f"    - {tag_name} (already exists, skipped)")
-                    skipped_count += 1
-                    continue
-                
-                # Add tag with subtag
-                tag = add_tag(
-                    db,
-                    name=tag_name,
-                    subtag_name=subtag_name
-                )
+            normalized_name = tag_name.strip().lower()
+            if normalized_name in created_names and normalized_name not in reported:
                 print(f"    ✓ {tag_name}")
-                added_count += 1
-                total_tags += 1
-            except ValueError as e:
-                print(f"    ✗ {tag_name}: {e}")
-            except Exception as e:
-                print(f"    ✗ {tag_name}: Unexpected error - {e}")
+            else:
+                print(f"    - {tag_name} (already exists, skipped)")
+            reported.add(normalized_name)
         
-        print(f"    ({added_count} added, {skipped_count} skipped)")
+        added_count = len(created)
+        total_tags += added_count
+        print(f"    ({added_count} added, {len(tag_names) - added_count} skipped)")
     
     print(f"\n  Total: {total_tags} tags added across {len(tag_files)} subtags")
 
@@ -436,21 +435,20 @@ def verify_recipes(db, recipes_dir: Path):
     print("Verifying Recipes")
     print("="*70)
     
-    # Get all recipes from database
-    from db_operations import list_recipes
-    all_recipes = list_recipes(db)
-    
-    if not all_recipes:
-        print("  No recipes in database to verify")
-        return
+    # Stream recipes from the database a batch at a time; each is checked once
+    from db_operations import iter_recipes
+    all_recipes = iter_recipes(db, load=('ingredients', 'tags', 'secondary_ingredients',
+                                         'clashing_ingredients', 'want_to_try_ingredients'))
     
     # Get all JSON files
     json_files = {f.stem: f for f in recipes_dir.glob('*.json')}
     
     issues_found = []
     verified_count = 0
+    total_recipes_in_db = 0
     
     for recipe in all_recipes:
+        total_recipes_in_db += 1
         if not recipe:
             continue
         
@@ -582,7 +580,9 @@ def verify_recipes(db, recipes_dir: Path):
         
         verified_count += 1
     
-    total_recipes_in_db = len(all_recipes)
+    if not total_recipes_in_db:
+        print("  No recipes in database to verify")
+        return
     
     if issues_found:
         print(f"\n  ✗ Found {len(issues_found)} verification issue(s):")
@@ -240,7 +240,7 @@ def cmd_list_ingredients_by_type(args):
     """List all ingredients, organized by type."""
     db = SessionLocal()
     try:
-        ingredients = list_ingredients(db)
+        ingredients = list_ingredients(db, load=('type', 'recipes'))
         if not ingredients:
             print("No ingredients found.")
         else:
@@ -285,38 +285,31 @@ def cmd_list_ingredients(args):
     """List all ingredients, search ingredients by name, or list ingredients by subtag."""
     db = SessionLocal()
     try:
-        from db_operations import list_ingredients, list_tags
+        from db_operations import list_ingredients, list_ingredients_matching, list_tags
         
         if hasattr(args, 'search') and args.search:
             search_term = args.search.lower()
             
             # Removed subtag search - ingredients no longer have tags
             # Just do name-based fuzzy search
-            ingredients = list_ingredients(db)
-            if not ingredients:
-                print("No ingredients found.")
+            # The substring match runs in SQL, so only matching ingredients are loaded
+            matches = list_ingredients_matching(db, search_term)
+            
+            # Sort by relevance (exact match first, then by position)
+            matches.sort(key=lambda i: (i.name.lower().startswith(search_term), i.name.lower().find(search_term)))
+            
+            # Show top 3
+            top_matches = matches[:3]
+            if not top_matches:
+                print(f"No ingredients found matching '{args.search}'")
             else:
-                # Simple fuzzy matching: check if search term is in ingredient name (case-insensitive)
-                matches = []
-                for ingredient in ingredients:
-                    if ingredient and search_term in ingredient.name.lower():
-                        matches.append(ingredient)
-                
-                # Sort by relevance (exact match first, then by position)
-                matches.sort(key=lambda i: (i.name.lower().startswith(search_term), i.name.lower().find(search_term)))
-                
-                # Show top 3
-                top_matches = matches[:3]
-                if not top_matches:
-                    print(f"No ingredients found matching '{args.search}'")
-                else:
-                    print(f"\n{'='*70}")
-                    print(f"Ingredients matching '{args.search}' (showing top {len(top_matches)})")
-                    print(f"{'='*70}")
-                    for ingredient in top_matches:
-                        type_name = ingredient.type.name if ingredient.type else '(no type)'
-                        print(f"  [{ingredient.id:3d}] {ingredient.name} ({type_name})")
-                    print()
+                print(f"\n{'='*70}")
+                print(f"Ingredients matching '{args.search}' (showing top {len(top_matches)})")
+                print(f"{'='*70}")
+                for ingredient in top_matches:
+                    type_name = ingredient.type.name if ingredient.type else '(no type)'
+                    print(f"  [{ingredient.id:3d}] {ingredient.name} ({type_name})")
+                print()
         else:
             # List all ingredients (compact format)
             ingredients = list_ingredients(db)
@@ -479,27 +472,34 @@ def cmd_list_recipes(args):
     """List all recipes, search recipes by name, or list recipes by subtag."""
     db = SessionLocal()
     try:
-        from db_operations import list_recipes, list_tags
+        from db_operations import list_recipes, list_recipes_matching, get_subtag
         
         if hasattr(args, 'search') and args.search:
             search_term = args.search.lower()
             
-            # Check if this is a subtag search (check if any tags have this subtag)
-            all_tags = list_tags(db)
-            tags_with_subtag = [t for t in all_tags if t.subtag and t.subtag.name.lower() == search_term]
+            # Check if this is a subtag search - subtag names are unique, so look the subtag up
+            # directly and take its tags rather than loading every tag and its subtag
+            subtag = get_subtag(db, name=search_term)
+            tags_with_subtag = list(subtag.tags) if subtag else []
             
             if tags_with_subtag:
                 # This is a subtag search - list recipes grouped by tag
-                all_recipes = list_recipes(db)
+                all_recipes = list_recipes(db, load=('tags',))
+                
+                # Bucket recipes by tag id in one pass, instead of scanning every recipe's
+                # tag list once per subtag tag
+                subtag_tag_ids = {tag.id for tag in tags_with_subtag}
+                recipes_by_tag_id = {}
+                for recipe in all_recipes:
+                    for tag in recipe.tags:
+                        if tag.id in subtag_tag_ids:
+                            recipes_by_tag_id.setdefault(tag.id, []).append(recipe)
                 
                 # Group recipes by tag name
                 recipes_by_tag = {}
                 tags_with_no_recipes = []
                 for tag in tags_with_subtag:
-                    recipes_with_tag = []
-                    for recipe in all_recipes:
-                        if recipe and tag in recipe.tags:
-                            recipes_with_tag.append(recipe)
+                    recipes_with_tag = recipes_by_tag_id.get(tag.id)
                     if recipes_with_tag:
                         recipes_by_tag[tag.name] = recipes_with_tag
                     else:
@@ -528,7 +528,7 @@ def cmd_list_recipes(args):
                     # Show recipes with no tags
                     recipes_with_no_tags = []
                     for recipe in all_recipes:
-                        if recipe and not recipe.tags:
+                        if not recipe.tags:
                             recipes_with_no_tags.append(recipe)
                     
                     if recipes_with_no_tags:
@@ -538,34 +538,28 @@ def cmd_list_recipes(args):
                     
                     print()
             else:
-                # Search mode: fuzzy match recipe names
-                recipes = list_recipes(db)
-                if not recipes:
-                    print("No recipes found.")
+                # Search mode: fuzzy match recipe names (only tags are needed, for the TODO marker)
+                # The substring match runs in SQL, so only matching recipes are loaded.
+                # Recipe names are stored lowercased, so only the search term needs lowering
+                matches = list_recipes_matching(db, search_term, load=('tags',))
+                
+                # Sort by relevance (exact match first, then by position)
+                matches.sort(key=lambda r: (r.name.startswith(search_term), r.name.find(search_term)))
+                
+                # Show top 3
+                top_matches = matches[:3]
+                if not top_matches:
+                    print(f"No recipes found matching '{args.search}'")
                 else:
-                    # Simple fuzzy matching: check if search term is in recipe name (case-insensitive)
-                    matches = []
-                    for recipe in recipes:
-                        if recipe and search_term in recipe.name.lower():
-                            matches.append(recipe)
-                    
-                    # Sort by relevance (exact match first, then by position)
-                    matches.sort(key=lambda r: (r.name.lower().startswith(search_term), r.name.lower().find(search_term)))
-                    
-                    # Show top 3
-                    top_matches = matches[:3]
-                    if not top_matches:
-                        print(f"No recipes found matching '{args.search}'")
-                    else:
-                        print(f"\n{'='*70}")
-                        print(f"Recipes matching '{args.search}' (showing top {len(top_matches)})")
-                        print(f"{'='*70}")
-                        for recipe in top_matches:
-                            print(f"  [{recipe.id:3d}] {format_recipe_name(recipe)}")
-                        print()
+                    print(f"\n{'='*70}")
+                    print(f"Recipes matching '{args.search}' (showing top {len(top_matches)})")
+                    print(f"{'='*70}")
+                    for recipe in top_matches:
+                        print(f"  [{recipe.id:3d}] {format_recipe_name(recipe)}")
+                    print()
         else:
             # List all recipes (compact format)
-            recipes = list_recipes(db)
+            recipes = list_recipes(db, load=('tags',))
             if not recipes:
                 print("No recipes found.")
             else:
@@ -576,25 +570,27 @@ def cmd_list_recipes(args):
                 # Check for subtags with no recipes
                 from db_operations import list_subtags, list_tags
                 all_subtags = list_subtags(db)
-                all_recipes = list_recipes(db)
                 all_tags = list_tags(db)
                 
-                # Get all tags that are used in recipes
+                # Get all tags that are used in recipes (the recipes listed above already have them loaded)
                 tags_in_recipes = set()
-                for recipe in all_recipes:
+                for recipe in recipes:
                     if recipe:
                         tags_in_recipes.update(tag.id for tag in recipe.tags if tag)
                 
+                # Group tag IDs by subtag once, instead of rescanning every tag (and loading its subtag) per subtag
+                tag_ids_by_subtag = {}
+                for tag in all_tags:
+                    if tag and tag.subtag_id is not None:
+                        tag_ids_by_subtag.setdefault(tag.subtag_id, []).append(tag.id)
+                
                 # Find subtags that have no recipes (tags with this subtag are not in any recipes)
                 subtags_with_no_recipes = []
                 for subtag in all_subtags:
-                    # Get all tags with this subtag
-                    tags_with_subtag = [tag for tag in all_tags if tag and tag.subtag and tag.subtag.id == subtag.id]
-                    # Check if any of these tags are in recipes
-                    if tags_with_subtag:
-                        has_recipes = any(tag.id in tags_in_recipes for tag in tags_with_subtag)
-                        if not has_recipes:
-                            subtags_with_no_recipes.append(subtag.name)
+                    # Check if any of this subtag's tags are in recipes
+                    tag_ids = tag_ids_by_subtag.get(subtag.id)
+                    if tag_ids and not any(tag_id in tags_in_recipes for tag_id in tag_ids):
+                        subtags_with_no_recipes.append(subtag.name)
                 
                 if subtags_with_no_recipes:
                     subtags_str = ', '.join(sorted(subtags_with_no_recipes))
@@ -632,7 +628,10 @@ def cmd_recipe_info(args):
     # Get and display recipe info
     db = SessionLocal()
     try:
-        recipe = get_recipe(db, recipe_id=recipe_id)
+        # Everything gets printed, so load every collection up front instead of one SELECT per ingredient
+        recipe = get_recipe(db, recipe_id=recipe_id, load=(
+            'ingredients', 'tags', 'secondary_ingredients', 'clashing_ingredients', 'want_to_try_ingredients'
+        ))
         if not recipe:
             print(f"✗ Error: Recipe not found (ID: {recipe_id})", file=sys.stderr)
             sys.exit(1)
@@ -1097,18 +1096,22 @@ def cmd_recipe_cook(args):
                 # Regular ingredient argument
                 ingredient_args.append(arg)
         
-        # Validate tag filters exist
+        # Validate tag filters exist, keeping their IDs so recipes can be checked with set operations
+        include_tag_ids = set()
         for tag_name in include_tags:
             tag = get_tag(db, name=tag_name)
             if not tag:
                 print(f"✗ Error: Tag '{tag_name}' not found. Use 'python cli.py tag list' to see available tags.", file=sys.stderr)
                 sys.exit(1)
+            include_tag_ids.add(tag.id)
         
+        exclude_tag_ids = set()
         for tag_name in exclude_tags:
             tag = get_tag(db, name=tag_name)
             if not tag:
                 print(f"✗ Error: Tag '{tag_name}' not found. Use 'python cli.py tag list' to see available tags.", file=sys.stderr)
                 sys.exit(1)
+            exclude_tag_ids.add(tag.id)
         
         # Handle ingredients with spaces:
         # - Join all arguments with spaces first (so "pumpkin puree" becomes one ingredient)
@@ -1139,106 +1142,32 @@ def cmd_recipe_cook(args):
             if not recipe:
                 continue
             
-            # Get recipe tag names (lowercase for comparison)
-            recipe_tag_names = {tag.name.lower() for tag in recipe.tags if tag}
+            recipe_tag_ids = {tag.id for tag in recipe.tags if tag}
             
-            # Check include tags (all must be present)
-            include_match = True
-            for tag_name in include_tags:
-                if tag_name.lower() not in recipe_tag_names:
-                    include_match = False
-                    break
-            
-            if not include_match:
-                continue
-            
-            # Check exclude tags (none should be present)
-            exclude_match = True
-            for tag_name in exclude_tags:
-                if tag_name.lower() in recipe_tag_names:
-                    exclude_match = False
-                    break
-            
-            if not exclude_match:
+            # Check include tags (all must be present) and exclude tags (none should be present)
+            if not include_tag_ids <= recipe_tag_ids or not exclude_tag_ids.isdisjoint(recipe_tag_ids):
                 continue
             
             # Recipe passed all filters
             filtered_results.append((recipe, match_count))
         
-        # Search for secondary ingredient matches
-        from db_operations import list_recipes, list_ingredient_types
-        from models import Ingredient
-        
-        # Build the same matching ingredient sets as primary search
-        requested_terms = [term.strip().lower() for term in ingredient_query.split(',') if term.strip()]
-        all_ingredients_list = db.query(Ingredient).all()
-        all_ingredients_in_db = {ing.name.lower(): ing for ing in all_ingredients_list if ing and ing.name}
-        all_types = list_ingredient_types(db)
-        all_types_in_db = {type_obj.name.lower(): type_obj for type_obj in all_types}
-        
-        term_matching_ingredients = {}
-        for term in requested_terms:
-            matching_ingredient_names = set()
-            if term in all_ingredients_in_db:
-                matching_ingredient_names.add(term)
-            elif term in all_types_in_db:
-                type_obj = all_types_in_db[term]
-                for ing in type_obj.ingredients:
-                    if ing and ing.name:
-                        matching_ingredient_names.add(ing.name.lower())
-            term_matching_ingredients[term] = matching_ingredient_names
-        
-        # Get all recipes and check secondary ingredients
-        all_recipes = list_recipes(db)
+        # Search for secondary ingredient matches (sorted by match count), skipping primary results
+        from db_operations import search_recipes_by_secondary_ingredients
         primary_recipe_ids = {recipe.id for recipe, _ in filtered_results if recipe}
         secondary_results = []
         
-        for recipe in all_recipes:
-            if not recipe or recipe.id in primary_recipe_ids:
-                continue  # Skip recipes already in primary results
+        for recipe, match_count in search_recipes_by_secondary_ingredients(
+            db, ingredient_query, exclude_recipe_ids=primary_recipe_ids
+        ):
+            # Apply tag filters to secondary results too
+            recipe_tag_ids = {tag.id for tag in recipe.tags if tag}
             
-            # Get recipe secondary ingredient names (lowercase) - includes both secondary_ingredients and want_to_try_ingredients
-            recipe_secondary_names = {ing.name.lower() for ing in recipe.secondary_ingredients if ing and ing.name}
-            recipe_want_to_try_names = {ing.name.lower() for ing in recipe.want_to_try_ingredients if ing and ing.name}
-            # Combine secondary and want_to_try ingredients for matching
-            all_secondary_names = recipe_secondary_names | recipe_want_to_try_names
-            
-            # Count matches in secondary/want_to_try ingredients
-            match_count = 0
-            for term, matching_ingredient_names in term_matching_ingredients.items():
-                matches = all_secondary_names & matching_ingredient_names
-                match_count += len(matches)
+            # Check include and exclude tags
+            if not include_tag_ids <= recipe_tag_ids or not exclude_tag_ids.isdisjoint(recipe_tag_ids):
+                continue
             
-            # Only include if there's at least one match
-            if match_count >= 1:
-                # Apply tag filters to secondary results too
-                recipe_tag_names = {tag.name.lower() for tag in recipe.tags if tag}
-                
-                # Check include tags
-                include_match = True
-                for tag_name in include_tags:
-                    if tag_name.lower() not in recipe_tag_names:
-                        include_match = False
-                        break
-                
-                if not include_match:
-                    continue
-                
-                # Check exclude tags
-                exclude_match = True
-                for tag_name in exclude_tags:
-                    if tag_name.lower() in recipe_tag_names:
-                        exclude_match = False
-                        break
-                
-                if not exclude_match:
-                    continue
-                
-                # Recipe passed all filters
-                secondary_results.append((recipe, match_count))
-        
-        # Sort secondary results by match count
-        secondary_results.sort(key=lambda x: x[1], reverse=True)
+            # Recipe passed all filters
+            secondary_results.append((recipe, match_count))
         
         # Display results
         if not filtered_results and not secondary_results:
@@ -1296,7 +1225,7 @@ def cmd_recipe_tag(args):
     """List recipes with a specific tag."""
     db = SessionLocal()
     try:
-        from db_operations import get_tag, list_recipes
+        from db_operations import get_tag, list_recipes_with_tag
         
         # Join all tag arguments with spaces to handle tags with spaces
         tag_name = ' '.join(args.tag)
@@ -1307,15 +1236,8 @@ def cmd_recipe_tag(args):
             print(f"✗ Error: Tag '{tag_name}' not found. Use 'python cli.py tag list' to see available tags.", file=sys.stderr)
             sys.exit(1)
         
-        # Get all recipes and filter by tag (use explicit ID comparison for reliability)
-        all_recipes = list_recipes(db)
-        matching_recipes = []
-        for recipe in all_recipes:
-            if recipe:
-                # Use explicit tag ID comparison instead of object identity
-                recipe_tag_ids = {t.id for t in recipe.tags if t}
-                if tag.id in recipe_tag_ids:
-                    matching_recipes.append(recipe)
+        # Filter by tag ID in SQL instead of loading every recipe (tags are loaded for the TODO marker)
+        matching_recipes = list_recipes_with_tag(db, tag.id)
         
         if not matching_recipes:
             print(f"No recipes found with tag '{tag_name}'")
@@ -1410,23 +1332,16 @@ def cmd_stats(args):
             max_article_id = db.query(Article.id).order_by(Article.id.desc()).first()[0]
             next_article_id = max_article_id + 1
         
-        # Calculate average ingredients per recipe
+        # Calculate average ingredients and tags per recipe. Ingredients and tags are
+        # eager-loaded, so this is a fixed number of queries rather than two per recipe
         avg_ingredients_per_recipe = 0.0
-        if recipe_count > 0:
-            total_ingredient_links = db.query(Recipe).join(Recipe.ingredients).count()
-            # Better approach: count total ingredients across all recipes
-            recipes_with_ingredients = db.query(Recipe).filter(Recipe.ingredients.any()).all()
-            total_ingredients_in_recipes = sum(len([ing for ing in recipe.ingredients if ing]) for recipe in recipes_with_ingredients if recipe)
-            if recipe_count > 0:
-                avg_ingredients_per_recipe = total_ingredients_in_recipes / recipe_count
-        
-        # Calculate average tags per recipe
         avg_tags_per_recipe = 0.0
         if recipe_count > 0:
-            recipes_with_tags = db.query(Recipe).filter(Recipe.tags.any()).all()
-            total_tags_in_recipes = sum(len([tag for tag in recipe.tags if tag]) for recipe in recipes_with_tags if recipe)
-            if recipe_count > 0:
-                avg_tags_per_recipe = total_tags_in_recipes / recipe_count
+            all_recipes = list_recipes(db, load=('ingredients', 'tags'))
+            total_ingredients_in_recipes = sum(len([ing for ing in recipe.ingredients if ing]) for recipe in all_recipes)
+            total_tags_in_recipes = sum(len([tag for tag in recipe.tags if tag]) for recipe in all_recipes)
+            avg_ingredients_per_recipe = total_ingredients_in_recipes / recipe_count
+            avg_tags_per_recipe = total_tags_in_recipes / recipe_count
         
         # Display stats
         print(f"\n{'='*70}")
@@ -1634,9 +1549,8 @@ def cmd_consistent(args):
             if recipe:
                 used_tag_ids.update(tag.id for tag in recipe.tags if tag)
         # Removed ingredient tag tracking - ingredients no longer have tags
-        # Check articles too
-        from models import Article
-        all_articles = db.query(Article).all()
+        # Check articles too (tags eager-loaded, not one SELECT per article)
+        all_articles = list_articles(db, load=('tags',))
         for article in all_articles:
             if article:
                 used_tag_ids.update(tag.id for tag in article.tags if tag)
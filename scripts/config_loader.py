@@ -19,6 +19,9 @@ DEFAULT_CONFIG = {
     'staging': {
         'addable_dir': 'staging/addable',
         'editable_dir': 'staging/editable'
+    },
+    'debug': {
+        'strict_loading': False
     }
 }
 
@@ -72,6 +75,12 @@ def get_similarity_threshold():
     return config.get('spell_check', {}).get('similarity_threshold', 70)
 
 
+def get_strict_loading():
+    """Whether recipe mutators should raise on relationship lazy loads (debug aid for N+1 queries)."""
+    config = get_config()
+    return config.get('debug', {}).get('strict_loading', False)
+
+
 def get_database_path():
     """Get the database file path."""
     config = get_config()
@@ -1,7 +1,7 @@
 """
 Database setup and session management.
 """
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from pathlib import Path
 from models import Base
@@ -15,7 +15,30 @@ DATABASE_URL = f"sqlite:///{db_path.absolute()}"
 # Create engine
 # Set echo=False for cleaner CLI output (set to True for debugging SQL queries)
 # Use connect_args to ensure SQLite commits are immediate
-engine = create_engine(DATABASE_URL, echo=False, connect_args={"check_same_thread": False})
+# insertmanyvalues_page_size caps how many rows go into each batched INSERT ... RETURNING
+engine = create_engine(
+    DATABASE_URL,
+    echo=False,
+    connect_args={"check_same_thread": False},
+    insertmanyvalues_page_size=1000
+)
+
+
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    Tune each new SQLite connection to keep temp tables and hot pages in memory.
+    The journal mode stays SQLite's default rollback journal (set explicitly to undo WAL
+    on databases an earlier version converted): cmd_backup and reset_database copy the
+    database file alone, which would miss commits still sitting in a -wal file.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=DELETE")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB
+    cursor.execute("PRAGMA cache_size=-64000")    # ~64 MB (negative = KiB)
+    cursor.close()
+
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -24,6 +47,10 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 def init_db():
     """Initialize the database by creating all tables."""
     Base.metadata.create_all(bind=engine)
+    # create_all skips existing tables, so also add any indexes declared after a table was created
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
 
 
 def get_db():
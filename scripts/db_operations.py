@@ -1,10 +1,19 @@
 """
 Database operations for recipes and ingredients.
 """
+import contextlib
 import warnings
-from sqlalchemy.orm import Session
+from collections import Counter, defaultdict
+from sqlalchemy import insert, update, delete, func, case, and_, or_, select, union
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session, Load, selectinload
 from sqlalchemy.exc import IntegrityError
-from models import Recipe, Ingredient, Tag, IngredientType, Article, Subtag
+from config_loader import get_strict_loading
+from models import (
+    Recipe, Ingredient, Tag, IngredientType, Article, Subtag, RecipeIngredient,
+    recipe_tags, article_tags, recipe_secondary_ingredients, recipe_clashing_ingredients,
+    recipe_want_to_try_ingredients
+)
 
 # Suppress urllib3/OpenSSL warnings
 try:
@@ -34,17 +43,18 @@ def normalize_name(name: str, check_spelling: bool = True) -> tuple[str, list[tu
     return name.strip().lower(), []
 
 
+def normalize_names_bulk(names: list[str]) -> list[str]:
+    """Normalize a list of names (strip + lowercase), one result per input name."""
+    return [name.strip().lower() for name in names]
+
+
 def normalize_tags(tags: list[str]) -> tuple[list[str], list[tuple[str, str]]]:
     """
     Normalize a list of tags: lowercase and strip.
     No spell checking or lemmatization.
     Returns (normalized_tags, empty corrections list for compatibility).
     """
-    normalized = []
-    for tag in tags:
-        if tag and tag.strip():
-            normalized.append(tag.strip().lower())
-    return normalized, []
+    return normalize_names_bulk([tag for tag in tags if tag and tag.strip()]), []
 
 
 def normalize_text_words(text: str) -> tuple[str, list[tuple[str, str]]]:
@@ -65,17 +75,224 @@ def check_spelling(name: str) -> tuple[bool, dict[str, list[str]]]:
     return (True, {})
 
 
-# ==================== INGREDIENT TYPE OPERATIONS ====================
+def _update_columns(db: Session, model, obj_id: int, values: dict, commit: bool = True):
+    """
+    Apply plain column changes with a single UPDATE statement (no SELECT beforehand).
+    Returns the updated object, or None if no row has that ID.
+    The UPDATE only matches when some column actually differs, so a no-op change
+    writes nothing and skips the commit.
+    With commit=False the UPDATE is left uncommitted and just the changed columns are expired.
+    """
+    if values:
+        differs = or_(*(getattr(model, column).is_distinct_from(value) for column, value in values.items()))
+        result = db.execute(update(model).where(model.id == obj_id, differs).values(**values))
+        if result.rowcount == 0:
+            # Missing row or nothing to change; the lookup tells the two apart
+            return db.get(model, obj_id)
+        if commit:
+            db.commit()
+        if not commit:
+            obj = db.get(model, obj_id)
+            db.expire(obj, list(values))
+            return obj
+    return db.get(model, obj_id)
+
+
+def _insert_new_rows(db: Session, model, rows: list[dict], commit: bool = True) -> list:
+    """
+    Insert rows whose (already normalized) 'name' isn't taken yet, using one INSERT ... RETURNING
+    that SQLAlchemy batches via insertmanyvalues. Duplicate and existing names are skipped.
+    Returns the created objects in input order. Commits unless commit=False.
+    """
+    rows_by_name = {}
+    for row in rows:
+        rows_by_name.setdefault(row['name'], row)
+    if not rows_by_name:
+        return []
+    
+    existing = {name for (name,) in db.query(model.name).filter(model.name.in_(list(rows_by_name))).all()}
+    new_rows = [row for name, row in rows_by_name.items() if name not in existing]
+    if not new_rows:
+        return []
+    
+    created = db.scalars(insert(model).returning(model, sort_by_parameter_order=True), new_rows).all()
+    if commit:
+        db.commit()
+    return created
 
-def get_or_create_ingredient_type(db: Session, type_name: str) -> IngredientType:
-    """Get an existing ingredient type or create it if it doesn't exist."""
-    type_obj = db.query(IngredientType).filter(IngredientType.name == type_name.lower()).first()
-    if not type_obj:
-        type_obj = IngredientType(name=type_name.lower())
-        db.add(type_obj)
+
+def _get_or_insert_by_name(db: Session, model, name: str, commit: bool = True):
+    """
+    Return the row with this (already normalized) name, creating it if needed. The INSERT is
+    tried first (see _insert_unless_exists) and the existing row is only SELECTed when the name
+    was taken, so a hit writes nothing and is never committed.
+    Commits a newly created row unless commit=False; either way the returned row already has its id.
+    """
+    obj = _insert_unless_exists(db, model, {'name': name})
+    if obj is None:
+        return db.query(model).filter(model.name == name).one()
+    
+    if commit:
         db.commit()
-        db.refresh(type_obj)
-    return type_obj
+    return obj
+
+
+def _insert_unless_exists(db: Session, model, values: dict):
+    """
+    Insert a row unless its (already normalized) name is taken. On SQLite this is one
+    INSERT ... ON CONFLICT(name) DO NOTHING RETURNING, so no separate existence check is needed.
+    Other dialects fall back to SELECT then INSERT + flush.
+    Returns the new row, or None if the name was already taken. Does not commit.
+    """
+    if db.get_bind().dialect.name == 'sqlite':
+        stmt = sqlite_insert(model).values(**values).on_conflict_do_nothing(index_elements=['name']).returning(model)
+        return db.scalars(stmt).first()
+    
+    if db.query(model.id).filter(model.name == values['name']).first():
+        return None
+    obj = model(**values)
+    db.add(obj)
+    db.flush()
+    return obj
+
+
+@contextlib.contextmanager
+def _no_expire_on_commit(db: Session):
+    """
+    Commit without expiring the session's objects, for mutations whose in-memory
+    state is already what was written (saves the reload SELECTs after commit).
+    """
+    previous = db.expire_on_commit
+    db.expire_on_commit = False
+    try:
+        yield
+    finally:
+        db.expire_on_commit = previous
+
+
+def _expire_loaded(db: Session, model, ids, attribute_names: list):
+    """
+    Expire attributes on the objects with these ids that are already in the session,
+    without loading the rest (those have nothing stale to reload).
+    """
+    for obj_id in ids:
+        obj = db.identity_map.get(db.identity_key(model, obj_id))
+        if obj is not None:
+            db.expire(obj, attribute_names)
+
+
+# debug.strict_loading in config.yaml: objects fetched by the list_* functions and get_recipe
+# raise on any relationship they did not eager-load, so hidden per-row SELECTs fail loudly
+_STRICT_LOADING = get_strict_loading()
+
+
+def _list_query(db: Session, model, loaders: dict, load):
+    """
+    Build the query for the list_* functions.
+    
+    Each name in `load` is eager-loaded with its entry from `loaders`; other
+    relationships load lazily, or raise with debug.strict_loading on.
+    """
+    options = []
+    for relationship_name in load:
+        if relationship_name not in loaders:
+            raise ValueError(f"Unknown relationship '{relationship_name}'. Choose from: {', '.join(loaders)}")
+        options.append(loaders[relationship_name])
+    if _STRICT_LOADING:
+        # Scoped to the listed model so related objects (e.g. Tag.subtag) stay lazy
+        options.append(Load(model).raiseload('*'))
+    return db.query(model).options(*options)
+
+
+def _get_tags_by_names(db: Session, tag_names: list, missing_ok: bool = False,
+                       unlinked_recipe_id: int = None, unlinked_article_id: int = None) -> list[Tag]:
+    """
+    Resolve tag names to Tag objects with a single IN query, preserving input order.
+    Raises ValueError listing every tag that doesn't exist (no auto-creation), unless
+    missing_ok is set (then unknown names are just skipped). With unlinked_recipe_id or
+    unlinked_article_id, tags already on that recipe/article are left out of the result,
+    using an outer join in the same query.
+    """
+    requested = {}
+    for normalized, tag_name in zip(normalize_names_bulk(tag_names), tag_names):
+        requested.setdefault(normalized, tag_name)
+    
+    query = db.query(Tag).filter(Tag.name.in_(list(requested)))
+    if unlinked_recipe_id is not None:
+        owner_column, owner_id = recipe_tags.c.recipe_id, unlinked_recipe_id
+    elif unlinked_article_id is not None:
+        owner_column, owner_id = article_tags.c.article_id, unlinked_article_id
+    else:
+        owner_column = None
+    if owner_column is None:
+        found = {tag.name: tag for tag in query.all()}
+    else:
+        link_table = owner_column.table
+        query = query.add_columns(owner_column).outerjoin(
+            link_table, and_(link_table.c.tag_id == Tag.id, owner_column == owner_id)
+        )
+        found = {}
+        for tag, linked_owner_id in query.all():
+            found[tag.name] = tag
+            if linked_owner_id is not None:
+                # Already linked: it exists, so it isn't missing, but it isn't returned either
+                del requested[tag.name]
+    if missing_ok:
+        return [found[normalized] for normalized in requested if normalized in found]
+    missing = [original for normalized, original in requested.items() if normalized not in found]
+    if missing:
+        if len(missing) == 1:
+            raise ValueError(f"Tag '{missing[0]}' not found. Add it first using 'python cli.py tag add'.")
+        missing_str = ", ".join(f"'{name}'" for name in missing)
+        raise ValueError(f"Tags {missing_str} not found. Add them first using 'python cli.py tag add'.")
+    return [found[normalized] for normalized in requested]
+
+
+def _get_ingredients_by_names(db: Session, ingredient_names: list, missing_ok: bool = False,
+                              unlinked_recipe_id: int = None) -> list[Ingredient]:
+    """
+    Resolve ingredient names to Ingredient objects with a single IN query, preserving input order.
+    Raises ValueError listing every ingredient that doesn't exist, unless missing_ok is set
+    (then unknown names are just skipped). With unlinked_recipe_id, ingredients already in that
+    recipe are left out of the result, using an outer join in the same query.
+    """
+    requested = {}
+    for normalized, ingredient_name in zip(normalize_names_bulk(ingredient_names), ingredient_names):
+        requested.setdefault(normalized, ingredient_name)
+    
+    query = db.query(Ingredient).filter(Ingredient.name.in_(list(requested)))
+    if unlinked_recipe_id is None:
+        found = {ing.name: ing for ing in query.all()}
+    else:
+        query = query.add_columns(RecipeIngredient.recipe_id).outerjoin(
+            RecipeIngredient,
+            and_(RecipeIngredient.ingredient_id == Ingredient.id, RecipeIngredient.recipe_id == unlinked_recipe_id)
+        )
+        found = {}
+        for ing, linked_recipe_id in query.all():
+            found[ing.name] = ing
+            if linked_recipe_id is not None:
+                # Already in the recipe: it exists, so it isn't missing, but it isn't returned either
+                del requested[ing.name]
+    if missing_ok:
+        return [found[normalized] for normalized in requested if normalized in found]
+    missing = [original for normalized, original in requested.items() if normalized not in found]
+    if missing:
+        if len(missing) == 1:
+            raise ValueError(f"Ingredient '{missing[0]}' not found. Add it first.")
+        missing_str = ", ".join(f"'{name}'" for name in missing)
+        raise ValueError(f"Ingredients {missing_str} not found. Add them first.")
+    return [found[normalized] for normalized in requested]
+
+
+# ==================== INGREDIENT TYPE OPERATIONS ====================
+
+def get_or_create_ingredient_type(db: Session, type_name: str, commit: bool = True) -> IngredientType:
+    """
+    Get an existing ingredient type or create it if it doesn't exist.
+    Pass commit=False to leave the insert in the caller's transaction (the id is still set).
+    """
+    return _get_or_insert_by_name(db, IngredientType, type_name.lower(), commit=commit)
 
 
 def list_ingredient_types(db: Session):
@@ -87,51 +304,56 @@ def add_ingredient_type(db: Session, name: str) -> IngredientType:
     """Add a new ingredient type to the database."""
     normalized_name = name.strip().lower()
     
-    # Check if type already exists
-    existing = db.query(IngredientType).filter(IngredientType.name == normalized_name).first()
-    if existing:
+    ingredient_type = _insert_unless_exists(db, IngredientType, {'name': normalized_name})
+    if ingredient_type is None:
+        existing = db.query(IngredientType.id).filter(IngredientType.name == normalized_name).first()
         raise ValueError(f"Ingredient type '{name}' already exists (ID: {existing.id})")
-    
-    ingredient_type = IngredientType(name=normalized_name)
-    db.add(ingredient_type)
     db.commit()
-    db.refresh(ingredient_type)
     return ingredient_type
 
 
+def add_ingredient_types_bulk(db: Session, names: list, commit: bool = True) -> list[IngredientType]:
+    """
+    Add many ingredient types in one statement. Existing names are skipped; returns the created types.
+    Pass commit=False to leave the INSERT uncommitted.
+    """
+    normalized_names, _ = normalize_tags(names)
+    return _insert_new_rows(db, IngredientType, [{'name': name} for name in normalized_names], commit=commit)
+
+
 def delete_ingredient_type(db: Session, type_id: int) -> bool:
     """Delete an ingredient type by ID. Returns True if deleted, False if not found."""
     ingredient_type = db.query(IngredientType).filter(IngredientType.id == type_id).first()
     if not ingredient_type:
         return False
     
-    # Check if any ingredients use this type
-    if ingredient_type.ingredients:
-        ingredient_names = [ing.name for ing in ingredient_type.ingredients if ing]
-        if ingredient_names:
-            raise ValueError(f"Cannot delete ingredient type '{ingredient_type.name}' (ID: {type_id}). It is used by {len(ingredient_names)} ingredient(s): {', '.join(ingredient_names[:5])}{'...' if len(ingredient_names) > 5 else ''}")
+    # Check if any ingredients use this type (count in SQL, only fetch names for the error preview)
+    ingredient_count = db.query(func.count(Ingredient.id)).filter(Ingredient.type_id == type_id).scalar()
+    if ingredient_count:
+        ingredient_names = [name for (name,) in db.query(Ingredient.name).filter(Ingredient.type_id == type_id).limit(6).all()]
+        raise ValueError(f"Cannot delete ingredient type '{ingredient_type.name}' (ID: {type_id}). It is used by {ingredient_count} ingredient(s): {', '.join(ingredient_names[:5])}{'...' if ingredient_count > 5 else ''}")
     
-    db.delete(ingredient_type)
+    # Nothing references the type, so skip the ORM's load of ingredient_type.ingredients
+    db.execute(delete(IngredientType).where(IngredientType.id == type_id))
     db.commit()
     return True
 
 
 def update_ingredient_type(db: Session, type_id: int, new_name: str) -> IngredientType:
     """Update an ingredient type's name."""
-    ingredient_type = db.query(IngredientType).filter(IngredientType.id == type_id).first()
-    if not ingredient_type:
-        raise ValueError(f"Ingredient type with ID {type_id} not found")
-    
     normalized_name = new_name.strip().lower()
     
-    # Check if new name already exists
-    existing = db.query(IngredientType).filter(IngredientType.name == normalized_name, IngredientType.id != type_id).first()
-    if existing:
+    # UNIQUE(name) catches collisions, so only look up the existing type when the UPDATE fails
+    try:
+        ingredient_type = _update_columns(db, IngredientType, type_id, {'name': normalized_name})
+    except IntegrityError:
+        db.rollback()
+        existing = db.query(IngredientType.id).filter(IngredientType.name == normalized_name).first()
+        if not existing:
+            raise
         raise ValueError(f"Ingredient type '{new_name}' already exists (ID: {existing.id})")
-    
-    ingredient_type.name = normalized_name
-    db.commit()
-    db.refresh(ingredient_type)
+    if not ingredient_type:
+        raise ValueError(f"Ingredient type with ID {type_id} not found")
     return ingredient_type
 
 
@@ -141,9 +363,14 @@ def add_ingredient(
     db: Session,
     name: str,
     type_name: str = None,
-    notes: str = None
+    notes: str = None,
+    commit: bool = True
 ) -> Ingredient:
-    """Add a new ingredient to the database."""
+    """Add a new ingredient to the database.
+    
+    Pass commit=False to leave the INSERT uncommitted (the id is still set), so
+    callers importing a whole recipe can commit once at the end.
+    """
     # Normalize name (convert to singular and lowercase)
     normalized_name, _ = normalize_name(name)
     
@@ -154,31 +381,23 @@ def add_ingredient(
         if not ingredient_type:
             raise ValueError(f"Ingredient type '{type_name}' not found. Add it first using 'python cli.py type add'.")
     
-    # Check if ingredient already exists (using normalized name)
-    existing = db.query(Ingredient).filter(Ingredient.name == normalized_name).first()
-    if existing:
-        raise ValueError(f"Ingredient '{name}' already exists (as '{existing.name}')")
-    
-    ingredient = Ingredient(name=normalized_name, type=ingredient_type, notes=notes)
-    
-    db.add(ingredient)
     try:
-        db.flush()  # Flush to get ID and check for immediate constraint violations
-        ingredient_id = ingredient.id
-        if ingredient_id is None:
-            # ID should be set after flush - if it's None, the table schema is likely incorrect
+        ingredient = _insert_unless_exists(db, Ingredient, {
+            'name': normalized_name,
+            'type_id': ingredient_type.id if ingredient_type else None,
+            'notes': notes
+        })
+        if ingredient is None:
+            existing = db.query(Ingredient.name).filter(Ingredient.name == normalized_name).first()
+            raise ValueError(f"Ingredient '{name}' already exists (as '{existing.name}')")
+        if ingredient.id is None:
+            # RETURNING gives back whatever id SQLite assigned - None means the table schema is likely incorrect
             # The ingredients table needs INTEGER PRIMARY KEY, not INT
             db.rollback()
             raise ValueError(f"Ingredient '{name}' ID was not generated. The database schema may be incorrect - the ingredients table 'id' column should be INTEGER PRIMARY KEY, not INT. Please check the database schema.")
-        db.commit()
-        # Re-query to get a fresh instance that's properly bound to the session
-        # This avoids any issues with the original ingredient object state
-        fresh_ingredient = db.query(Ingredient).filter(Ingredient.id == ingredient_id).first()
-        if not fresh_ingredient:
-            # Commit succeeded but ingredient not found - this shouldn't happen
-            # But if it does, it means the commit was rolled back or failed silently
-            raise ValueError(f"Ingredient '{name}' commit appeared to succeed but ingredient not found in database")
-        return fresh_ingredient
+        if commit:
+            db.commit()
+        return ingredient
     except IntegrityError as e:
         db.rollback()
         # Check if it's a unique constraint violation
@@ -191,10 +410,42 @@ def add_ingredient(
         raise
 
 
+def add_ingredients_bulk(db: Session, ingredients: list, commit: bool = True) -> list[Ingredient]:
+    """
+    Add many ingredients in one statement.
+    
+    Args:
+        ingredients: List of dicts with 'name' and optional 'type_name' / 'notes'
+        commit: Pass False to leave the INSERT uncommitted, e.g. when loading many files
+    
+    Existing names are skipped. Returns the created ingredients.
+    """
+    type_names = {item['type_name'].strip().lower() for item in ingredients if item.get('type_name')}
+    type_ids = {}
+    if type_names:
+        type_ids = dict(db.query(IngredientType.name, IngredientType.id).filter(IngredientType.name.in_(type_names)).all())
+        missing_types = sorted(type_names - type_ids.keys())
+        if missing_types:
+            raise ValueError(f"Ingredient type '{missing_types[0]}' not found. Add it first using 'python cli.py type add'.")
+    
+    rows = []
+    for item in ingredients:
+        normalized_name, _ = normalize_name(item['name'])
+        if not normalized_name:
+            continue
+        type_name = item.get('type_name')
+        rows.append({
+            'name': normalized_name,
+            'type_id': type_ids[type_name.strip().lower()] if type_name else None,
+            'notes': item.get('notes'),
+        })
+    return _insert_new_rows(db, Ingredient, rows, commit=commit)
+
+
 def get_ingredient(db: Session, name: str = None, ingredient_id: int = None) -> Ingredient:
     """Get an ingredient by name or ID."""
     if ingredient_id:
-        return db.query(Ingredient).filter(Ingredient.id == ingredient_id).first()
+        return db.get(Ingredient, ingredient_id)
     if name:
         # Normalize name for lookup (convert plural to singular)
         normalized_name, _ = normalize_name(name)
@@ -202,9 +453,35 @@ def get_ingredient(db: Session, name: str = None, ingredient_id: int = None) ->
     return None
 
 
-def list_ingredients(db: Session):
-    """List all ingredients."""
-    return db.query(Ingredient).all()
+_INGREDIENT_LOADERS = {
+    'type': selectinload(Ingredient.type),
+    'recipes': selectinload(Ingredient.recipe_associations).selectinload(RecipeIngredient.recipe),
+}
+
+
+def list_ingredients(db: Session, load: tuple = ('type',)):
+    """
+    List all ingredients.
+    
+    Relationships named in `load` (any of 'type', 'recipes') are eager-loaded;
+    the rest load lazily, or raise with debug.strict_loading on.
+    """
+    return _list_query(db, Ingredient, _INGREDIENT_LOADERS, load).all()
+
+
+def list_ingredients_matching(db: Session, search_term: str, load: tuple = ('type',)):
+    """
+    List the ingredients whose name contains `search_term`, in ID order.
+    
+    The substring match is a LIKE in SQL, so only candidates are loaded;
+    `load` works as in list_ingredients.
+    """
+    return (
+        _list_query(db, Ingredient, _INGREDIENT_LOADERS, load)
+        .filter(Ingredient.name.contains(search_term, autoescape=True))
+        .order_by(Ingredient.id)
+        .all()
+    )
 
 
 def delete_ingredient(db: Session, name: str = None, ingredient_id: int = None) -> bool:
@@ -213,7 +490,11 @@ def delete_ingredient(db: Session, name: str = None, ingredient_id: int = None)
     if not ingredient:
         raise ValueError(f"Ingredient not found")
     
-    db.delete(ingredient)
+    # Delete association rows directly instead of loading and cascading each one
+    db.execute(delete(RecipeIngredient).where(RecipeIngredient.ingredient_id == ingredient.id).execution_options(synchronize_session=False))
+    for table in (recipe_secondary_ingredients, recipe_clashing_ingredients, recipe_want_to_try_ingredients):
+        db.execute(delete(table).where(table.c.ingredient_id == ingredient.id))
+    db.execute(delete(Ingredient).where(Ingredient.id == ingredient.id))
     db.commit()
     return True
 
@@ -227,6 +508,13 @@ def update_ingredient(
     notes: str = None
 ) -> Ingredient:
     """Update basic ingredient fields (name, type, notes)."""
+    if ingredient_id and new_name is None and type_name is None:
+        # Notes-only change: no uniqueness or type validation needed
+        ingredient = _update_columns(db, Ingredient, ingredient_id, {'notes': notes} if notes is not None else {})
+        if not ingredient:
+            raise ValueError(f"Ingredient not found")
+        return ingredient
+    
     ingredient = get_ingredient(db, name=name, ingredient_id=ingredient_id)
     if not ingredient:
         raise ValueError(f"Ingredient not found")
@@ -234,11 +522,7 @@ def update_ingredient(
     if new_name is not None:
         # Normalize new name (convert to singular and lowercase)
         normalized_new_name, _ = normalize_name(new_name)
-        
-        # Check if new name already exists
-        existing = db.query(Ingredient).filter(Ingredient.name == normalized_new_name, Ingredient.id != ingredient.id).first()
-        if existing:
-            raise ValueError(f"Ingredient '{new_name}' already exists (as '{existing.name}')")
+        # Collisions are caught by UNIQUE(name) at commit
         ingredient.name = normalized_new_name
     
     if type_name is not None:
@@ -254,9 +538,14 @@ def update_ingredient(
     if notes is not None:
         ingredient.notes = notes
     
-    
-    db.commit()
-    db.refresh(ingredient)
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        existing = db.query(Ingredient.name).filter(Ingredient.name == normalized_new_name).first() if new_name is not None else None
+        if not existing:
+            raise
+        raise ValueError(f"Ingredient '{new_name}' already exists (as '{existing.name}')")
     return ingredient
 
 
@@ -265,21 +554,16 @@ def update_ingredient(
 
 # ==================== TAG OPERATIONS ====================
 
-def get_or_create_tag(db: Session, tag_name: str) -> Tag:
+def get_or_create_tag(db: Session, tag_name: str, commit: bool = True) -> Tag:
     """
     Get an existing tag or create it if it doesn't exist.
     Normalizes tag name (spell check + lowercase + singularize) silently.
+    Pass commit=False to leave the insert in the caller's transaction (the id is still set).
     """
     # Normalize tag name (spell check + lowercase + singularize)
     normalized_tag, _ = normalize_name(tag_name, check_spelling=True)
     
-    tag = db.query(Tag).filter(Tag.name == normalized_tag).first()
-    if not tag:
-        tag = Tag(name=normalized_tag)
-        db.add(tag)
-        db.commit()
-        db.refresh(tag)
-    return tag
+    return _get_or_insert_by_name(db, Tag, normalized_tag, commit=commit)
 
 
 # ==================== SUBTAG OPERATIONS ====================
@@ -287,7 +571,7 @@ def get_or_create_tag(db: Session, tag_name: str) -> Tag:
 def get_subtag(db: Session, subtag_id: int = None, name: str = None) -> Subtag:
     """Get a subtag by ID or name."""
     if subtag_id:
-        return db.query(Subtag).filter(Subtag.id == subtag_id).first()
+        return db.get(Subtag, subtag_id)
     elif name:
         normalized_name = name.strip().lower()
         return db.query(Subtag).filter(Subtag.name == normalized_name).first()
@@ -303,51 +587,56 @@ def add_subtag(db: Session, name: str) -> Subtag:
     """Add a new subtag to the database."""
     normalized_name = name.strip().lower()
     
-    # Check if subtag already exists
-    existing = db.query(Subtag).filter(Subtag.name == normalized_name).first()
-    if existing:
+    subtag = _insert_unless_exists(db, Subtag, {'name': normalized_name})
+    if subtag is None:
+        existing = db.query(Subtag.id).filter(Subtag.name == normalized_name).first()
         raise ValueError(f"Subtag '{name}' already exists (ID: {existing.id})")
-    
-    subtag = Subtag(name=normalized_name)
-    db.add(subtag)
     db.commit()
-    db.refresh(subtag)
     return subtag
 
 
+def add_subtags_bulk(db: Session, names: list, commit: bool = True) -> list[Subtag]:
+    """
+    Add many subtags in one statement. Existing names are skipped; returns the created subtags.
+    Pass commit=False to leave the INSERT uncommitted.
+    """
+    normalized_names, _ = normalize_tags(names)
+    return _insert_new_rows(db, Subtag, [{'name': name} for name in normalized_names], commit=commit)
+
+
 def delete_subtag(db: Session, subtag_id: int) -> bool:
     """Delete a subtag by ID. Returns True if deleted, False if not found."""
     subtag = db.query(Subtag).filter(Subtag.id == subtag_id).first()
     if not subtag:
         return False
     
-    # Check if any tags use this subtag
-    tags_using_subtag = [tag for tag in subtag.tags if tag and tag.subtag_id == subtag_id]
-    if tags_using_subtag:
-        tag_names = [tag.name for tag in tags_using_subtag]
-        raise ValueError(f"Cannot delete subtag '{subtag.name}' (ID: {subtag_id}). It is used by {len(tags_using_subtag)} tag(s): {', '.join(tag_names[:5])}{'...' if len(tag_names) > 5 else ''}")
+    # Check if any tags use this subtag (count in SQL, only fetch names for the error preview)
+    tag_count = db.query(func.count(Tag.id)).filter(Tag.subtag_id == subtag_id).scalar()
+    if tag_count:
+        tag_names = [name for (name,) in db.query(Tag.name).filter(Tag.subtag_id == subtag_id).limit(6).all()]
+        raise ValueError(f"Cannot delete subtag '{subtag.name}' (ID: {subtag_id}). It is used by {tag_count} tag(s): {', '.join(tag_names[:5])}{'...' if tag_count > 5 else ''}")
     
-    db.delete(subtag)
+    # Nothing references the subtag, so skip the ORM's load of subtag.tags
+    db.execute(delete(Subtag).where(Subtag.id == subtag_id))
     db.commit()
     return True
 
 
 def update_subtag(db: Session, subtag_id: int, new_name: str) -> Subtag:
     """Update a subtag's name."""
-    subtag = db.query(Subtag).filter(Subtag.id == subtag_id).first()
-    if not subtag:
-        raise ValueError(f"Subtag with ID {subtag_id} not found")
-    
     normalized_name = new_name.strip().lower()
     
-    # Check if new name already exists
-    existing = db.query(Subtag).filter(Subtag.name == normalized_name, Subtag.id != subtag_id).first()
-    if existing:
+    # UNIQUE(name) catches collisions, so only look up the existing subtag when the UPDATE fails
+    try:
+        subtag = _update_columns(db, Subtag, subtag_id, {'name': normalized_name})
+    except IntegrityError:
+        db.rollback()
+        existing = db.query(Subtag.id).filter(Subtag.name == normalized_name).first()
+        if not existing:
+            raise
         raise ValueError(f"Subtag '{new_name}' already exists (ID: {existing.id})")
-    
-    subtag.name = normalized_name
-    db.commit()
-    db.refresh(subtag)
+    if not subtag:
+        raise ValueError(f"Subtag with ID {subtag_id} not found")
     return subtag
 
 
@@ -367,11 +656,6 @@ def add_tag(db: Session, name: str, subtag_name: str = None) -> Tag:
     """
     normalized_name = name.strip().lower()
     
-    # Check if tag already exists
-    existing = db.query(Tag).filter(Tag.name == normalized_name).first()
-    if existing:
-        raise ValueError(f"Tag '{name}' already exists (ID: {existing.id})")
-    
     # Get subtag if provided (must exist - no auto-creation)
     subtag_obj = None
     if subtag_name:
@@ -379,38 +663,49 @@ def add_tag(db: Session, name: str, subtag_name: str = None) -> Tag:
         if not subtag_obj:
             raise ValueError(f"Subtag '{subtag_name}' not found. Add it first using 'python cli.py subtag add'.")
     
-    tag = Tag(name=normalized_name, subtag=subtag_obj)
-    db.add(tag)
+    tag = _insert_unless_exists(db, Tag, {'name': normalized_name, 'subtag_id': subtag_obj.id if subtag_obj else None})
+    if tag is None:
+        existing = db.query(Tag.id).filter(Tag.name == normalized_name).first()
+        raise ValueError(f"Tag '{name}' already exists (ID: {existing.id})")
     db.commit()
-    db.refresh(tag)
     return tag
 
 
+def add_tags_bulk(db: Session, names: list, subtag_name: str = None, commit: bool = True) -> list[Tag]:
+    """
+    Add many tags in one statement, all under the same optional subtag (must exist).
+    Existing names are skipped. Returns the created tags.
+    Pass commit=False to leave the INSERT uncommitted.
+    """
+    subtag_id = None
+    if subtag_name:
+        subtag_obj = get_subtag(db, name=subtag_name)
+        if not subtag_obj:
+            raise ValueError(f"Subtag '{subtag_name}' not found. Add it first using 'python cli.py subtag add'.")
+        subtag_id = subtag_obj.id
+    
+    normalized_names, _ = normalize_tags(names)
+    return _insert_new_rows(db, Tag, [{'name': name, 'subtag_id': subtag_id} for name in normalized_names],
+                            commit=commit)
+
+
 def delete_tag(db: Session, tag_id: int) -> bool:
     """Delete a tag by ID. Returns True if deleted, False if not found."""
-    tag = db.query(Tag).filter(Tag.id == tag_id).first()
-    if not tag:
-        return False
-    
-    # Remove tag from all recipes
-    for recipe in list(tag.recipes):
-        recipe.tags.remove(tag)
-    
-    # Removed ingredient tag removal - ingredients no longer have tags
-    
-    # Remove tag from all articles
-    for article in list(tag.articles):
-        article.tags.remove(tag)
-    
-    db.delete(tag)
+    # Remove tag from all recipes and articles with one DELETE per junction table
+    # (ingredients no longer have tags)
+    db.execute(delete(recipe_tags).where(recipe_tags.c.tag_id == tag_id))
+    db.execute(delete(article_tags).where(article_tags.c.tag_id == tag_id))
+    result = db.execute(delete(Tag).where(Tag.id == tag_id))
     db.commit()
+    if result.rowcount == 0:
+        return False
     return True
 
 
 def get_tag(db: Session, tag_id: int = None, name: str = None) -> Tag:
     """Get a tag by ID or name."""
     if tag_id:
-        return db.query(Tag).filter(Tag.id == tag_id).first()
+        return db.get(Tag, tag_id)
     elif name:
         normalized_name = name.strip().lower()
         return db.query(Tag).filter(Tag.name == normalized_name).first()
@@ -420,7 +715,7 @@ def get_tag(db: Session, tag_id: int = None, name: str = None) -> Tag:
 def get_ingredient_type(db: Session, type_id: int = None, name: str = None) -> IngredientType:
     """Get an ingredient type by ID or name."""
     if type_id:
-        return db.query(IngredientType).filter(IngredientType.id == type_id).first()
+        return db.get(IngredientType, type_id)
     elif name:
         normalized_name = name.strip().lower()
         return db.query(IngredientType).filter(IngredientType.name == normalized_name).first()
@@ -434,6 +729,21 @@ def update_tag(db: Session, tag_id: int, new_name: str = ..., new_subtag_name: s
         new_name: New name for the tag (Ellipsis means don't update, None means clear - but names can't be None)
         new_subtag_name: New subtag name (Ellipsis means don't update, None means clear it, string means set to that subtag)
     """
+    if new_name is ...:
+        # Subtag-only change: no name collision check needed
+        values = {}
+        if new_subtag_name is not ...:
+            subtag_obj = None
+            if new_subtag_name and new_subtag_name.strip():
+                subtag_obj = get_subtag(db, name=new_subtag_name)
+                if not subtag_obj:
+                    raise ValueError(f"Subtag '{new_subtag_name}' not found. Add it first using 'python cli.py subtag add'.")
+            values['subtag_id'] = subtag_obj.id if subtag_obj else None
+        tag = _update_columns(db, Tag, tag_id, values)
+        if not tag:
+            raise ValueError(f"Tag with ID {tag_id} not found")
+        return tag
+    
     tag = db.query(Tag).filter(Tag.id == tag_id).first()
     if not tag:
         raise ValueError(f"Tag with ID {tag_id} not found")
@@ -443,10 +753,7 @@ def update_tag(db: Session, tag_id: int, new_name: str = ..., new_subtag_name: s
         if new_name:
             normalized_name = new_name.strip().lower()
             if normalized_name != tag.name:
-                # Check if new name already exists
-                existing = db.query(Tag).filter(Tag.name == normalized_name).first()
-                if existing and existing.id != tag_id:
-                    raise ValueError(f"Tag with name '{new_name}' already exists (ID: {existing.id})")
+                # Collisions are caught by UNIQUE(name) at commit
                 tag.name = normalized_name
         else:
             raise ValueError("Tag name cannot be empty")
@@ -462,8 +769,14 @@ def update_tag(db: Session, tag_id: int, new_name: str = ..., new_subtag_name: s
         else:
             tag.subtag = None
     
-    db.commit()
-    db.refresh(tag)
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        existing = db.query(Tag.id).filter(Tag.name == new_name.strip().lower()).first()
+        if not existing:
+            raise
+        raise ValueError(f"Tag with name '{new_name}' already exists (ID: {existing.id})")
     return tag
 
 
@@ -483,30 +796,33 @@ def add_article(
     
     # Add tags (must exist - no auto-creation)
     if tags:
-        tag_objects = []
-        for tag_name in tags:
-            tag_obj = get_tag(db, name=tag_name)
-            if not tag_obj:
-                raise ValueError(f"Tag '{tag_name}' not found. Add it first using 'python cli.py tag add'.")
-            tag_objects.append(tag_obj)
-        article.tags = tag_objects
+        article.tags = _get_tags_by_names(db, tags)
     
     db.add(article)
     db.commit()
-    db.refresh(article)
     return article
 
 
 def get_article(db: Session, article_id: int = None) -> Article:
     """Get an article by ID."""
     if article_id:
-        return db.query(Article).filter(Article.id == article_id).first()
+        return db.get(Article, article_id)
     return None
 
 
-def list_articles(db: Session):
-    """List all articles."""
-    return db.query(Article).all()
+_ARTICLE_LOADERS = {
+    'tags': selectinload(Article.tags),
+}
+
+
+def list_articles(db: Session, load: tuple = ('tags',)):
+    """
+    List all articles.
+    
+    Relationships named in `load` (only 'tags') are eager-loaded; the rest
+    load lazily, or raise with debug.strict_loading on.
+    """
+    return _list_query(db, Article, _ARTICLE_LOADERS, load).all()
 
 
 def update_article(
@@ -515,15 +831,11 @@ def update_article(
     notes: str = None
 ) -> Article:
     """Update an article's notes."""
-    article = get_article(db, article_id=article_id)
+    article = None
+    if article_id:
+        article = _update_columns(db, Article, article_id, {'notes': notes} if notes is not None else {})
     if not article:
         raise ValueError(f"Article not found")
-    
-    if notes is not None:
-        article.notes = notes
-    
-    db.commit()
-    db.refresh(article)
     return article
 
 
@@ -541,9 +853,14 @@ def delete_article(db: Session, article_id: int = None) -> bool:
 def add_tags_to_article(
     db: Session,
     article_id: int = None,
-    tag_names: list = None
+    tag_names: list = None,
+    commit: bool = True
 ) -> Article:
-    """Add tags to an existing article."""
+    """Add tags to an existing article.
+    
+    Pass commit=False to leave the INSERT uncommitted, so callers adding to
+    many articles can commit once at the end.
+    """
     article = get_article(db, article_id=article_id)
     if not article:
         raise ValueError(f"Article not found")
@@ -551,31 +868,34 @@ def add_tags_to_article(
     if not tag_names:
         return article
     
-    current_tag_names = {tag.name for tag in article.tags}
-    new_tags = []
-    
-    for tag_name in tag_names:
-        if tag_name.lower() in current_tag_names:
-            continue  # Skip if already tagged
-        
-        tag_obj = get_tag(db, name=tag_name)
-        if not tag_obj:
-            raise ValueError(f"Tag '{tag_name}' not found. Add it first using 'python cli.py tag add'.")
-        new_tags.append(tag_obj)
-    
-    if new_tags:
-        article.tags.extend(new_tags)
-    db.commit()
-    db.refresh(article)
+    # One SELECT resolves the names and skips tags already on the article, so
+    # article.tags is never loaded just to check membership
+    new_tags = _get_tags_by_names(db, tag_names, unlinked_article_id=article.id)
+    
+    if not new_tags:
+        return article  # Nothing to add, so skip the commit round-trip
+    db.execute(insert(article_tags), [{'article_id': article.id, 'tag_id': tag_obj.id} for tag_obj in new_tags])
+    if commit:
+        with _no_expire_on_commit(db):
+            db.commit()
+    # The INSERT bypassed both sides of the link, so reload just those collections on next access
+    db.expire(article, ['tags'])
+    for tag_obj in new_tags:
+        db.expire(tag_obj, ['articles'])
     return article
 
 
 def remove_tags_from_article(
     db: Session,
     article_id: int = None,
-    tag_names: list = None
+    tag_names: list = None,
+    commit: bool = True
 ) -> Article:
-    """Remove tags from an existing article."""
+    """Remove tags from an existing article.
+    
+    Pass commit=False to leave the DELETE uncommitted, so callers changing
+    several links at once can commit once at the end.
+    """
     article = get_article(db, article_id=article_id)
     if not article:
         raise ValueError(f"Article not found")
@@ -583,17 +903,23 @@ def remove_tags_from_article(
     if not tag_names:
         return article
     
-    tags_to_remove = []
-    for tag_name in tag_names:
-        tag_obj = db.query(Tag).filter(Tag.name == tag_name.lower()).first()
-        if tag_obj and tag_obj in article.tags:
-            tags_to_remove.append(tag_obj)
-    
-    for tag in tags_to_remove:
-        article.tags.remove(tag)
-    
-    db.commit()
-    db.refresh(article)
+    # One DELETE on the junction table, resolving the names in a subquery; unknown or absent
+    # tags simply match no rows. RETURNING says which tags actually lost the article
+    requested_ids = select(Tag.id).where(Tag.name.in_(set(normalize_names_bulk(tag_names))))
+    removed_tag_ids = db.scalars(
+        delete(article_tags)
+        .where(article_tags.c.article_id == article.id, article_tags.c.tag_id.in_(requested_ids))
+        .returning(article_tags.c.tag_id)
+    ).all()
+    if not removed_tag_ids:
+        return article  # None of them were on the article, so skip the commit round-trip
+    
+    if commit:
+        with _no_expire_on_commit(db):
+            db.commit()
+    # The DELETE bypassed both sides of the link, so reload just those collections on next access
+    db.expire(article, ['tags'])
+    _expire_loaded(db, Tag, removed_tag_ids, ['articles'])
     return article
 
 
@@ -612,7 +938,7 @@ def add_recipe(
     normalized_name, _ = normalize_name(name)
     
     # Check if recipe already exists (using normalized name)
-    existing = db.query(Recipe).filter(Recipe.name == normalized_name).first()
+    existing = db.query(Recipe.name).filter(Recipe.name == normalized_name).first()
     if existing:
         raise ValueError(f"Recipe '{name}' already exists (as '{existing.name}')")
     
@@ -624,34 +950,29 @@ def add_recipe(
     
     # Add tags (must exist - no auto-creation)
     if tags:
-        tag_objects = []
-        for tag_name in tags:
-            tag_obj = get_tag(db, name=tag_name)
-            if not tag_obj:
-                raise ValueError(f"Tag '{tag_name}' not found. Add it first using 'python cli.py tag add'.")
-            tag_objects.append(tag_obj)
-        recipe.tags = tag_objects
+        recipe.tags = _get_tags_by_names(db, tags)
     
     # Add ingredients
     if ingredients:
-        ingredient_objects = []
-        for ingredient_name in ingredients:
-            ingredient_obj = get_ingredient(db, name=ingredient_name)
-            if not ingredient_obj:
-                raise ValueError(f"Ingredient '{ingredient_name}' not found. Add it first.")
-            ingredient_objects.append(ingredient_obj)
-        recipe.ingredients = ingredient_objects
+        recipe.ingredients = _get_ingredients_by_names(db, ingredients)
     
     db.add(recipe)
     db.commit()
-    db.refresh(recipe)
     return recipe
 
 
-def get_recipe(db: Session, name: str = None, recipe_id: int = None) -> Recipe:
-    """Get a recipe by name or ID."""
+def get_recipe(db: Session, name: str = None, recipe_id: int = None, load: tuple = ()) -> Recipe:
+    """
+    Get a recipe by name or ID.
+    
+    Relationships named in `load` (as in list_recipes) are selectin-loaded
+    up front, for callers about to read them all (e.g. to display or export
+    the recipe); the rest load lazily, or raise with debug.strict_loading on.
+    """
+    if load or _STRICT_LOADING:
+        return _get_recipe_loaded(db, name=name, recipe_id=recipe_id, load=load)
     if recipe_id:
-        return db.query(Recipe).filter(Recipe.id == recipe_id).first()
+        return db.get(Recipe, recipe_id)
     if name:
         # Normalize name for lookup (convert plural to singular)
         normalized_name, _ = normalize_name(name)
@@ -659,9 +980,88 @@ def get_recipe(db: Session, name: str = None, recipe_id: int = None) -> Recipe:
     return None
 
 
-def list_recipes(db: Session):
-    """List all recipes."""
-    return db.query(Recipe).all()
+def _require_recipe(db: Session, name: str = None, recipe_id: int = None, load: tuple = ()) -> Recipe:
+    """get_recipe for the recipe mutators: raises ValueError instead of returning None."""
+    recipe = get_recipe(db, name=name, recipe_id=recipe_id, load=load)
+    if not recipe:
+        raise ValueError(f"Recipe not found")
+    return recipe
+
+
+_RECIPE_LOADERS = {
+    'ingredients': selectinload(Recipe.ingredient_associations).selectinload(RecipeIngredient.ingredient),
+    'tags': selectinload(Recipe.tags),
+    'secondary_ingredients': selectinload(Recipe.secondary_ingredients),
+    'clashing_ingredients': selectinload(Recipe.clashing_ingredients),
+    'want_to_try_ingredients': selectinload(Recipe.want_to_try_ingredients),
+}
+
+
+def _get_recipe_loaded(db: Session, name: str = None, recipe_id: int = None, load: tuple = ()) -> Recipe:
+    """Like get_recipe, but eager-loads the relationships named in `load` (keys of _RECIPE_LOADERS)."""
+    options = [_RECIPE_LOADERS[relationship_name] for relationship_name in load]
+    if _STRICT_LOADING:
+        options.append(Load(Recipe).raiseload('*'))
+    query = db.query(Recipe).options(*options)
+    if recipe_id:
+        return query.filter(Recipe.id == recipe_id).first()
+    if name:
+        normalized_name, _ = normalize_name(name)
+        return query.filter(Recipe.name == normalized_name).first()
+    return None
+
+
+def list_recipes(db: Session, load: tuple = ('ingredients', 'tags')):
+    """
+    List all recipes.
+    
+    Relationships named in `load` (any of 'ingredients', 'tags',
+    'secondary_ingredients', 'clashing_ingredients', 'want_to_try_ingredients')
+    are eager-loaded; the rest load lazily, or raise with debug.strict_loading on.
+    """
+    return _list_query(db, Recipe, _RECIPE_LOADERS, load).all()
+
+
+def iter_recipes(db: Session, load: tuple = ('ingredients', 'tags'), batch_size: int = 500):
+    """
+    Iterate over all recipes, in ID order, fetching `batch_size` rows at a time.
+    
+    For single-pass scans of the whole catalog: unlike list_recipes, the rows and
+    their eager-loaded relationships are never all in memory at once. Iterate it
+    fully while `db` is still open. `load` works as in list_recipes.
+    """
+    return _list_query(db, Recipe, _RECIPE_LOADERS, load).order_by(Recipe.id).yield_per(batch_size)
+
+
+def list_recipes_with_tag(db: Session, tag_id: int, load: tuple = ('tags',)):
+    """
+    List the recipes carrying a tag, in ID order.
+    
+    The filtering happens in SQL through the recipe_tags junction table, so
+    only matching recipes are loaded. `load` works as in list_recipes.
+    """
+    return (
+        _list_query(db, Recipe, _RECIPE_LOADERS, load)
+        .join(recipe_tags, recipe_tags.c.recipe_id == Recipe.id)
+        .filter(recipe_tags.c.tag_id == tag_id)
+        .order_by(Recipe.id)
+        .all()
+    )
+
+
+def list_recipes_matching(db: Session, search_term: str, load: tuple = ('tags',)):
+    """
+    List the recipes whose name contains `search_term`, in ID order.
+    
+    The substring match is a LIKE in SQL, so only candidates are loaded;
+    `load` works as in list_recipes.
+    """
+    return (
+        _list_query(db, Recipe, _RECIPE_LOADERS, load)
+        .filter(Recipe.name.contains(search_term, autoescape=True))
+        .order_by(Recipe.id)
+        .all()
+    )
 
 
 # REMOVED: All fuzzy matching and semantic search functions removed
@@ -702,40 +1102,26 @@ def search_recipes_by_ingredients_exact(
         List of tuples: (recipe, match_count) sorted by match_count descending
         match_count is the total number of matching ingredients found in the recipe
     """
-    # Parse comma-delimited ingredients/types
-    requested_terms = [term.strip().lower() for term in ingredient_query.split(',') if term.strip()]
+    # Parse comma-delimited ingredients/types (duplicates only count once)
+    requested_terms = list(dict.fromkeys(term.strip().lower() for term in ingredient_query.split(',') if term.strip()))
     if not requested_terms:
         return []
     
-    # Get all ingredients and types from database
-    all_ingredients_list = db.query(Ingredient).all()
-    all_ingredients_in_db = {ing.name.lower(): ing for ing in all_ingredients_list if ing and ing.name}
-    all_types = list_ingredient_types(db)
-    all_types_in_db = {type_obj.name.lower(): type_obj for type_obj in all_types}
+    # Resolve each term to an ingredient or a type with one IN query per table
+    ingredient_ids = dict(db.query(Ingredient.name, Ingredient.id).filter(Ingredient.name.in_(requested_terms)).all())
+    type_ids = dict(db.query(IngredientType.name, IngredientType.id).filter(IngredientType.name.in_(requested_terms)).all())
     
-    # Build a set of ingredient names that match each search term
-    # Each term can be either an ingredient name or a type name
-    term_matching_ingredients = {}
+    # Build one SQL condition per term: an exact ingredient match, or any ingredient of the type
+    term_conditions = []
     missing_terms = []
     
     for term in requested_terms:
-        matching_ingredient_names = set()
-        
-        # Check if it's an exact ingredient match
-        if term in all_ingredients_in_db:
-            matching_ingredient_names.add(term)
-        # Check if it's a type name
-        elif term in all_types_in_db:
-            type_obj = all_types_in_db[term]
-            # Get all ingredients of this type
-            for ing in type_obj.ingredients:
-                if ing and ing.name:
-                    matching_ingredient_names.add(ing.name.lower())
+        if term in ingredient_ids:
+            term_conditions.append(Ingredient.id == ingredient_ids[term])
+        elif term in type_ids:
+            term_conditions.append(Ingredient.type_id == type_ids[term])
         else:
             missing_terms.append(term)
-            continue
-        
-        term_matching_ingredients[term] = matching_ingredient_names
     
     # Validate - report missing terms
     if missing_terms:
@@ -744,47 +1130,106 @@ def search_recipes_by_ingredients_exact(
         else:
             missing_str = ", ".join(f"\"{term}\"" for term in missing_terms)
             raise ValueError(f"Ingredients or types {missing_str} do not exist. Please check the spelling and try again.")
+    
+    # Count matches in SQL: each recipe ingredient scores one point per term it satisfies,
+    # so recipes with several ingredients of a searched type score higher
+    match_count = func.sum(sum(case((condition, 1), else_=0) for condition in term_conditions))
+    query = (
+        db.query(Recipe, match_count)
+        .outerjoin(RecipeIngredient, RecipeIngredient.recipe_id == Recipe.id)
+        .outerjoin(Ingredient, Ingredient.id == RecipeIngredient.ingredient_id)
+    )
+    if min_matches > 0:
+        # Only rows that can contribute a match need to be aggregated
+        query = query.filter(or_(*term_conditions))
+    
+    # Sort by match count descending (more matches = higher rank); ties keep recipe ID order
+    rows = (
+        query.options(selectinload(Recipe.tags))
+        .group_by(Recipe.id)
+        .having(match_count >= min_matches)
+        .order_by(match_count.desc(), Recipe.id)
+        .all()
+    )
+    
+    return [(recipe, count) for recipe, count in rows]
 
-    # Get all recipes
-    all_recipes = db.query(Recipe).all()
-    if not all_recipes:
+
+def search_recipes_by_secondary_ingredients(
+    db: Session,
+    ingredient_query: str,
+    exclude_recipe_ids=()
+) -> list:
+    """
+    Find recipes whose secondary or want-to-try ingredients match a search ("almost matches").
+    
+    Terms are resolved like in search_recipes_by_ingredients_exact (ingredient name or type);
+    unknown terms are ignored. Each distinct secondary/want-to-try ingredient of a recipe
+    scores one point per term it satisfies.
+    
+    Args:
+        db: Database session
+        ingredient_query: Comma-delimited list of ingredient names or types
+        exclude_recipe_ids: Recipe IDs to leave out (e.g. the primary results)
+    
+    Returns:
+        List of tuples: (recipe, match_count) sorted by match_count descending, ties in recipe ID order
+    """
+    # Parse comma-delimited ingredients/types (duplicates only count once)
+    requested_terms = list(dict.fromkeys(term.strip().lower() for term in ingredient_query.split(',') if term.strip()))
+    if not requested_terms:
         return []
     
-    # For each recipe, count matches (ingredient name or type)
-    results = []
-    for recipe in all_recipes:
-        if not recipe:
-            continue
-        # Get recipe ingredient names (normalized to lowercase), filtering out None ingredients
-        recipe_ingredient_names = {ing.name.lower() for ing in recipe.ingredients if ing and ing.name}
-        
-        # Count how many requested terms match this recipe
-        # For types, count each matching ingredient (not just 1 per type)
-        match_count = 0
-        for term, matching_ingredient_names in term_matching_ingredients.items():
-            # Count all matching ingredients (not just check if any match exists)
-            # This allows recipes with multiple ingredients of the same type to score higher
-            matches = recipe_ingredient_names & matching_ingredient_names
-            match_count += len(matches)
-        
-        # Only include recipes that meet the minimum match requirement
-        if match_count >= min_matches:
-            results.append((recipe, match_count))
+    ingredient_ids = dict(db.query(Ingredient.name, Ingredient.id).filter(Ingredient.name.in_(requested_terms)).all())
+    type_ids = dict(db.query(IngredientType.name, IngredientType.id).filter(IngredientType.name.in_(requested_terms)).all())
+    type_members = defaultdict(set)
+    if type_ids:
+        for type_id, ingredient_id in db.query(Ingredient.type_id, Ingredient.id).filter(Ingredient.type_id.in_(list(type_ids.values()))):
+            type_members[type_id].add(ingredient_id)
     
-    # Sort by match count descending (more matches = higher rank)
-    # Recipes with same match count are kept in their original order
-    results.sort(key=lambda x: x[1], reverse=True)
+    # Ingredient ID -> number of terms it satisfies
+    term_hits = Counter()
+    for term in requested_terms:
+        if term in ingredient_ids:
+            term_hits[ingredient_ids[term]] += 1
+        elif term in type_ids:
+            term_hits.update(type_members[type_ids[term]])
+    if not term_hits:
+        return []
     
-    return results
+    # Every (recipe, ingredient) edge touching a searched ingredient in one query, instead of
+    # loading both collections for every recipe; UNION drops an ingredient listed in both
+    edges = union(*(
+        select(table.c.recipe_id, table.c.ingredient_id).where(table.c.ingredient_id.in_(list(term_hits)))
+        for table in (recipe_secondary_ingredients, recipe_want_to_try_ingredients)
+    ))
+    match_counts = Counter()
+    for recipe_id, ingredient_id in db.execute(edges):
+        if recipe_id not in exclude_recipe_ids:
+            match_counts[recipe_id] += term_hits[ingredient_id]
+    if not match_counts:
+        return []
+    
+    recipes = (
+        db.query(Recipe)
+        .options(selectinload(Recipe.tags))
+        .filter(Recipe.id.in_(list(match_counts)))
+        .order_by(Recipe.id)
+        .all()
+    )
+    # Stable sort, so ties keep recipe ID order
+    return sorted(((recipe, match_counts[recipe.id]) for recipe in recipes), key=lambda x: x[1], reverse=True)
 
 
 def delete_recipe(db: Session, name: str = None, recipe_id: int = None) -> bool:
     """Delete a recipe by name or ID."""
-    recipe = get_recipe(db, name, recipe_id)
-    if not recipe:
-        raise ValueError(f"Recipe not found")
+    recipe = _require_recipe(db, name=name, recipe_id=recipe_id)
     
-    db.delete(recipe)
+    # Delete association rows directly instead of loading and cascading each one
+    db.execute(delete(RecipeIngredient).where(RecipeIngredient.recipe_id == recipe.id).execution_options(synchronize_session=False))
+    for table in (recipe_tags, recipe_secondary_ingredients, recipe_clashing_ingredients, recipe_want_to_try_ingredients):
+        db.execute(delete(table).where(table.c.recipe_id == recipe.id))
+    db.execute(delete(Recipe).where(Recipe.id == recipe.id))
     db.commit()
     return True
 
@@ -795,31 +1240,52 @@ def update_recipe(
     name: str = None,
     new_name: str = None,
     instructions: str = None,
-    notes: str = None
+    notes: str = None,
+    commit: bool = True
 ) -> Recipe:
-    """Update basic recipe fields (name, instructions, notes)."""
-    recipe = get_recipe(db, name=name, recipe_id=recipe_id)
-    if not recipe:
-        raise ValueError(f"Recipe not found")
+    """Update basic recipe fields (name, instructions, notes).
     
+    Pass commit=False to leave the changes uncommitted, so callers editing
+    several parts of a recipe can commit once at the end.
+    """
+    if recipe_id and new_name is None:
+        # Instructions/notes-only change: no uniqueness check needed
+        values = {}
+        if instructions is not None:
+            values['instructions'] = instructions
+        if notes is not None:
+            values['notes'] = notes
+        recipe = _update_columns(db, Recipe, recipe_id, values, commit=commit)
+        if not recipe:
+            raise ValueError(f"Recipe not found")
+        return recipe
+    
+    recipe = _require_recipe(db, name=name, recipe_id=recipe_id)
+    
+    changed = False
     if new_name is not None:
         # Normalize new name (convert to singular and lowercase)
         normalized_new_name, _ = normalize_name(new_name)
         
-        # Check if new name already exists
-        existing = db.query(Recipe).filter(Recipe.name == normalized_new_name, Recipe.id != recipe.id).first()
-        if existing:
-            raise ValueError(f"Recipe '{new_name}' already exists (as '{existing.name}')")
-        recipe.name = normalized_new_name
-    
-    if instructions is not None:
+        if normalized_new_name != recipe.name:
+            # Check if new name already exists
+            existing = db.query(Recipe.name).filter(Recipe.name == normalized_new_name, Recipe.id != recipe.id).first()
+            if existing:
+                raise ValueError(f"Recipe '{new_name}' already exists (as '{existing.name}')")
+            recipe.name = normalized_new_name
+            changed = True
+    
+    if instructions is not None and instructions != recipe.instructions:
         recipe.instructions = instructions
+        changed = True
     
-    if notes is not None:
+    if notes is not None and notes != recipe.notes:
         recipe.notes = notes
+        changed = True
     
-    db.commit()
-    db.refresh(recipe)
+    # Skip the commit round-trip when every field already had its requested value
+    if changed and commit:
+        db.commit()
     return recipe
 
 
@@ -827,34 +1293,35 @@ def add_ingredients_to_recipe(
     db: Session,
     recipe_id: int = None,
     name: str = None,
-    ingredient_names: list = None
+    ingredient_names: list = None,
+    commit: bool = True
 ) -> Recipe:
-    """Add ingredients to an existing recipe."""
-    recipe = get_recipe(db, name=name, recipe_id=recipe_id)
-    if not recipe:
-        raise ValueError(f"Recipe not found")
+    """Add ingredients to an existing recipe.
+    
+    Pass commit=False to leave the INSERT uncommitted, so callers adding to
+    many recipes can commit once at the end.
+    """
+    recipe = _require_recipe(db, name=name, recipe_id=recipe_id)
     
     if not ingredient_names:
         return recipe
     
-    current_ingredient_names = {ing.name for ing in recipe.ingredients}
-    new_ingredients = []
-    
-    for ingredient_name in ingredient_names:
-        # Normalize ingredient name (convert plural to singular)
-        normalized_name, _ = normalize_name(ingredient_name)
-        if normalized_name in current_ingredient_names:
-            continue  # Skip if already in recipe
-        
-        ingredient_obj = get_ingredient(db, name=normalized_name)
-        if not ingredient_obj:
-            raise ValueError(f"Ingredient '{ingredient_name}' not found. Add it first.")
-        new_ingredients.append(ingredient_obj)
-    
-    if new_ingredients:
-        recipe.ingredients.extend(new_ingredients)
-    db.commit()
-    db.refresh(recipe)
+    # Resolve the names and drop ingredients already in the recipe in one query (an outer join
+    # against this recipe's links), so the current ingredients are never loaded
+    new_ingredients = _get_ingredients_by_names(db, ingredient_names, unlinked_recipe_id=recipe.id)
+    
+    if not new_ingredients:
+        return recipe  # Nothing to add, so skip the commit round-trip
+    db.execute(insert(RecipeIngredient), [
+        {'recipe_id': recipe.id, 'ingredient_id': ingredient.id} for ingredient in new_ingredients
+    ])
+    if commit:
+        with _no_expire_on_commit(db):
+            db.commit()
+    # The INSERT bypassed both sides of the link, so reload just those collections on next access
+    db.expire(recipe, ['ingredient_associations'])
+    for ingredient in new_ingredients:
+        db.expire(ingredient, ['recipe_associations'])
     return recipe
 
 
@@ -862,30 +1329,35 @@ def remove_ingredients_from_recipe(
     db: Session,
     recipe_id: int = None,
     name: str = None,
-    ingredient_names: list = None
+    ingredient_names: list = None,
+    commit: bool = True
 ) -> Recipe:
-    """Remove ingredients from an existing recipe."""
-    recipe = get_recipe(db, name=name, recipe_id=recipe_id)
-    if not recipe:
-        raise ValueError(f"Recipe not found")
+    """Remove ingredients from an existing recipe.
+    
+    Pass commit=False to leave the DELETE uncommitted, so callers changing
+    several links at once can commit once at the end.
+    """
+    recipe = _require_recipe(db, name=name, recipe_id=recipe_id)
     
     if not ingredient_names:
         return recipe
     
-    ingredients_to_remove = []
-    for ingredient_name in ingredient_names:
-        # Normalize ingredient name (convert plural to singular)
-        normalized_name, _ = normalize_name(ingredient_name)
-        ingredient_obj = get_ingredient(db, name=normalized_name)
-        if ingredient_obj and ingredient_obj in recipe.ingredients:
-            ingredients_to_remove.append(ingredient_obj)
-    
-    if ingredients_to_remove:
-        for ingredient in ingredients_to_remove:
-            recipe.ingredients.remove(ingredient)
-    
-    db.commit()
-    db.refresh(recipe)
+    # One DELETE on the association table, resolving the names in a subquery; unknown or
+    # absent ingredients simply match no rows
+    requested_ids = select(Ingredient.id).where(Ingredient.name.in_(set(normalize_names_bulk(ingredient_names))))
+    result = db.execute(
+        delete(RecipeIngredient)
+        .where(RecipeIngredient.recipe_id == recipe.id, RecipeIngredient.ingredient_id.in_(requested_ids))
+        .execution_options(synchronize_session=False)
+    )
+    if not result.rowcount:
+        return recipe  # None of them were in the recipe, so skip the commit round-trip
+    
+    if commit:
+        db.commit()  # Expires recipe, so its associations reload on next access
+    else:
+        # The DELETE bypassed the collection, so reload it on next access
+        db.expire(recipe, ['ingredient_associations'])
     return recipe
 
 
@@ -893,32 +1365,33 @@ def add_tags_to_recipe(
     db: Session,
     recipe_id: int = None,
     name: str = None,
-    tag_names: list = None
+    tag_names: list = None,
+    commit: bool = True
 ) -> Recipe:
-    """Add tags to an existing recipe."""
-    recipe = get_recipe(db, name=name, recipe_id=recipe_id)
-    if not recipe:
-        raise ValueError(f"Recipe not found")
+    """Add tags to an existing recipe.
+    
+    Pass commit=False to leave the INSERT uncommitted, so callers tagging
+    many recipes can commit once at the end.
+    """
+    recipe = _require_recipe(db, name=name, recipe_id=recipe_id)
     
     if not tag_names:
         return recipe
     
-    current_tag_names = {tag.name for tag in recipe.tags}
-    new_tags = []
-    
-    for tag_name in tag_names:
-        if tag_name.lower() in current_tag_names:
-            continue  # Skip if already tagged
-        
-        tag_obj = get_tag(db, name=tag_name)
-        if not tag_obj:
-            raise ValueError(f"Tag '{tag_name}' not found. Add it first using 'python cli.py tag add'.")
-        new_tags.append(tag_obj)
-    
-    if new_tags:
-        recipe.tags.extend(new_tags)
-    db.commit()
-    db.refresh(recipe)
+    # One SELECT resolves the names and skips tags already on the recipe, so recipe.tags
+    # is never loaded just to check membership
+    new_tags = _get_tags_by_names(db, tag_names, unlinked_recipe_id=recipe.id)
+    
+    if not new_tags:
+        return recipe  # Nothing to add, so skip the commit round-trip
+    db.execute(insert(recipe_tags), [{'recipe_id': recipe.id, 'tag_id': tag_obj.id} for tag_obj in new_tags])
+    if commit:
+        with _no_expire_on_commit(db):
+            db.commit()
+    # The INSERT bypassed both sides of the link, so reload just those collections on next access
+    db.expire(recipe, ['tags'])
+    for tag_obj in new_tags:
+        db.expire(tag_obj, ['recipes'])
     return recipe
 
 
@@ -926,217 +1399,177 @@ def remove_tags_from_recipe(
     db: Session,
     recipe_id: int = None,
     name: str = None,
-    tag_names: list = None
+    tag_names: list = None,
+    commit: bool = True
 ) -> Recipe:
-    """Remove tags from an existing recipe."""
-    recipe = get_recipe(db, name=name, recipe_id=recipe_id)
-    if not recipe:
-        raise ValueError(f"Recipe not found")
+    """Remove tags from an existing recipe.
+    
+    Pass commit=False to leave the DELETE uncommitted, so callers changing
+    several links at once can commit once at the end.
+    """
+    recipe = _require_recipe(db, name=name, recipe_id=recipe_id)
     
     if not tag_names:
         return recipe
     
-    tags_to_remove = []
-    for tag_name in tag_names:
-        tag_obj = db.query(Tag).filter(Tag.name == tag_name.lower()).first()
-        if tag_obj and tag_obj in recipe.tags:
-            tags_to_remove.append(tag_obj)
-    
-    if tags_to_remove:
-        for tag in tags_to_remove:
-            recipe.tags.remove(tag)
-    db.commit()
-    db.refresh(recipe)
+    # One DELETE on the junction table, resolving the names in a subquery; unknown or absent
+    # tags simply match no rows. RETURNING says which tags actually lost the recipe
+    requested_ids = select(Tag.id).where(Tag.name.in_(set(normalize_names_bulk(tag_names))))
+    removed_tag_ids = db.scalars(
+        delete(recipe_tags)
+        .where(recipe_tags.c.recipe_id == recipe.id, recipe_tags.c.tag_id.in_(requested_ids))
+        .returning(recipe_tags.c.tag_id)
+    ).all()
+    if not removed_tag_ids:
+        return recipe  # None of them were on the recipe, so skip the commit round-trip
+    
+    if commit:
+        with _no_expire_on_commit(db):
+            db.commit()
+    # The DELETE bypassed both sides of the link, so reload just those collections on next access
+    db.expire(recipe, ['tags'])
+    _expire_loaded(db, Tag, removed_tag_ids, ['recipes'])
     return recipe
 
 
-def add_secondary_ingredients_to_recipe(
-    db: Session,
-    recipe_id: int = None,
-    name: str = None,
-    ingredient_names: list = None
-) -> Recipe:
-    """Add secondary ingredients to an existing recipe (for logging only)."""
-    recipe = get_recipe(db, name=name, recipe_id=recipe_id)
-    if not recipe:
-        raise ValueError(f"Recipe not found")
+def _add_listed_ingredients(db: Session, relationship_name: str, recipe_id: int, name: str, ingredient_names: list,
+                            commit: bool = True) -> Recipe:
+    """Shared body of add_{secondary,clashing,want_to_try}_ingredients_to_recipe."""
+    # The list is diffed below, so it comes in with the recipe
+    recipe = _require_recipe(db, name=name, recipe_id=recipe_id, load=(relationship_name,))
     
     if not ingredient_names:
         return recipe
     
-    current_secondary_names = {ing.name for ing in recipe.secondary_ingredients}
-    new_ingredients = []
+    listed_ingredients = getattr(recipe, relationship_name)
+    current_names = {ing.name for ing in listed_ingredients}
+    # Skip ingredients that are already on the list
+    new_ingredient_names = [
+        ingredient_name for ingredient_name, normalized in zip(ingredient_names, normalize_names_bulk(ingredient_names))
+        if normalized not in current_names
+    ]
+    
+    if not new_ingredient_names:
+        return recipe  # Nothing to add, so skip the commit round-trip
+    listed_ingredients.extend(_get_ingredients_by_names(db, new_ingredient_names))
+    if commit:
+        # The list was changed through the ORM, so it already matches the database
+        with _no_expire_on_commit(db):
+            db.commit()
+    else:
+        db.flush()
+    return recipe
+
+
+def _remove_listed_ingredients(db: Session, relationship_name: str, recipe_id: int, name: str, ingredient_names: list,
+                               commit: bool = True) -> Recipe:
+    """Shared body of remove_{secondary,clashing,want_to_try}_ingredients_from_recipe."""
+    recipe = _require_recipe(db, name=name, recipe_id=recipe_id)
     
-    for ingredient_name in ingredient_names:
-        normalized_name, _ = normalize_name(ingredient_name)
-        if normalized_name in current_secondary_names:
-            continue
-        
-        ingredient_obj = get_ingredient(db, name=normalized_name)
-        if not ingredient_obj:
-            raise ValueError(f"Ingredient '{ingredient_name}' not found. Add it first.")
-        new_ingredients.append(ingredient_obj)
+    if not ingredient_names:
+        return recipe
     
-    if new_ingredients:
-        recipe.secondary_ingredients.extend(new_ingredients)
-    db.commit()
-    db.refresh(recipe)
+    # One DELETE on the junction table, resolving the names in a subquery; unknown or
+    # absent ingredients simply match no rows
+    table = getattr(Recipe, relationship_name).property.secondary
+    requested_ids = select(Ingredient.id).where(Ingredient.name.in_(set(normalize_names_bulk(ingredient_names))))
+    result = db.execute(delete(table).where(table.c.recipe_id == recipe.id, table.c.ingredient_id.in_(requested_ids)))
+    if not result.rowcount:
+        return recipe  # None of them were on the list, so skip the commit round-trip
+    
+    if commit:
+        with _no_expire_on_commit(db):
+            db.commit()
+    # The DELETE bypassed the collection, so reload just that list on next access
+    db.expire(recipe, [relationship_name])
     return recipe
 
 
-def remove_secondary_ingredients_from_recipe(
+def add_secondary_ingredients_to_recipe(
     db: Session,
     recipe_id: int = None,
     name: str = None,
-    ingredient_names: list = None
+    ingredient_names: list = None,
+    commit: bool = True
 ) -> Recipe:
-    """Remove secondary ingredients from an existing recipe."""
-    recipe = get_recipe(db, name=name, recipe_id=recipe_id)
-    if not recipe:
-        raise ValueError(f"Recipe not found")
-    
-    if not ingredient_names:
-        return recipe
-    
-    ingredients_to_remove = []
-    for ingredient_name in ingredient_names:
-        normalized_name, _ = normalize_name(ingredient_name)
-        ingredient_obj = get_ingredient(db, name=normalized_name)
-        if ingredient_obj and ingredient_obj in recipe.secondary_ingredients:
-            ingredients_to_remove.append(ingredient_obj)
+    """Add secondary ingredients to an existing recipe (for logging only).
     
-    if ingredients_to_remove:
-        for ingredient in ingredients_to_remove:
-            recipe.secondary_ingredients.remove(ingredient)
+    Pass commit=False to only flush, so callers editing several lists can
+    commit once at the end.
+    """
+    return _add_listed_ingredients(db, 'secondary_ingredients', recipe_id, name, ingredient_names, commit=commit)
+
+
+def remove_secondary_ingredients_from_recipe(
+    db: Session,
+    recipe_id: int = None,
+    name: str = None,
+    ingredient_names: list = None,
+    commit: bool = True
+) -> Recipe:
+    """Remove secondary ingredients from an existing recipe.
     
-    db.commit()
-    db.refresh(recipe)
-    return recipe
+    Pass commit=False to leave the DELETE uncommitted, so callers changing
+    several links at once can commit once at the end.
+    """
+    return _remove_listed_ingredients(db, 'secondary_ingredients', recipe_id, name, ingredient_names, commit=commit)
 
 
 def add_clashing_ingredients_to_recipe(
     db: Session,
     recipe_id: int = None,
     name: str = None,
-    ingredient_names: list = None
+    ingredient_names: list = None,
+    commit: bool = True
 ) -> Recipe:
-    """Add clashing ingredients to an existing recipe (for logging only)."""
-    recipe = get_recipe(db, name=name, recipe_id=recipe_id)
-    if not recipe:
-        raise ValueError(f"Recipe not found")
-    
-    if not ingredient_names:
-        return recipe
-    
-    current_clashing_names = {ing.name for ing in recipe.clashing_ingredients}
-    new_ingredients = []
+    """Add clashing ingredients to an existing recipe (for logging only).
     
-    for ingredient_name in ingredient_names:
-        normalized_name, _ = normalize_name(ingredient_name)
-        if normalized_name in current_clashing_names:
-            continue
-        
-        ingredient_obj = get_ingredient(db, name=normalized_name)
-        if not ingredient_obj:
-            raise ValueError(f"Ingredient '{ingredient_name}' not found. Add it first.")
-        new_ingredients.append(ingredient_obj)
-    
-    if new_ingredients:
-        recipe.clashing_ingredients.extend(new_ingredients)
-    db.commit()
-    db.refresh(recipe)
-    return recipe
+    Pass commit=False to only flush, so callers editing several lists can
+    commit once at the end.
+    """
+    return _add_listed_ingredients(db, 'clashing_ingredients', recipe_id, name, ingredient_names, commit=commit)
 
 
 def remove_clashing_ingredients_from_recipe(
     db: Session,
     recipe_id: int = None,
     name: str = None,
-    ingredient_names: list = None
+    ingredient_names: list = None,
+    commit: bool = True
 ) -> Recipe:
-    """Remove clashing ingredients from an existing recipe."""
-    recipe = get_recipe(db, name=name, recipe_id=recipe_id)
-    if not recipe:
-        raise ValueError(f"Recipe not found")
-    
-    if not ingredient_names:
-        return recipe
+    """Remove clashing ingredients from an existing recipe.
     
-    ingredients_to_remove = []
-    for ingredient_name in ingredient_names:
-        normalized_name, _ = normalize_name(ingredient_name)
-        ingredient_obj = get_ingredient(db, name=normalized_name)
-        if ingredient_obj and ingredient_obj in recipe.clashing_ingredients:
-            ingredients_to_remove.append(ingredient_obj)
-    
-    if ingredients_to_remove:
-        for ingredient in ingredients_to_remove:
-            recipe.clashing_ingredients.remove(ingredient)
-    
-    db.commit()
-    db.refresh(recipe)
-    return recipe
+    Pass commit=False to leave the DELETE uncommitted, so callers changing
+    several links at once can commit once at the end.
+    """
+    return _remove_listed_ingredients(db, 'clashing_ingredients', recipe_id, name, ingredient_names, commit=commit)
 
 
 def add_want_to_try_ingredients_to_recipe(
     db: Session,
     recipe_id: int = None,
     name: str = None,
-    ingredient_names: list = None
+    ingredient_names: list = None,
+    commit: bool = True
 ) -> Recipe:
-    """Add want to try ingredients to an existing recipe (for logging only)."""
-    recipe = get_recipe(db, name=name, recipe_id=recipe_id)
-    if not recipe:
-        raise ValueError(f"Recipe not found")
-    
-    if not ingredient_names:
-        return recipe
-    
-    current_want_to_try_names = {ing.name for ing in recipe.want_to_try_ingredients}
-    new_ingredients = []
+    """Add want to try ingredients to an existing recipe (for logging only).
     
-    for ingredient_name in ingredient_names:
-        normalized_name, _ = normalize_name(ingredient_name)
-        if normalized_name in current_want_to_try_names:
-            continue
-        
-        ingredient_obj = get_ingredient(db, name=normalized_name)
-        if not ingredient_obj:
-            raise ValueError(f"Ingredient '{ingredient_name}' not found. Add it first.")
-        new_ingredients.append(ingredient_obj)
-    
-    if new_ingredients:
-        recipe.want_to_try_ingredients.extend(new_ingredients)
-    db.commit()
-    db.refresh(recipe)
-    return recipe
+    Pass commit=False to only flush, so callers editing several lists can
+    commit once at the end.
+    """
+    return _add_listed_ingredients(db, 'want_to_try_ingredients', recipe_id, name, ingredient_names, commit=commit)
 
 
 def remove_want_to_try_ingredients_from_recipe(
     db: Session,
     recipe_id: int = None,
     name: str = None,
-    ingredient_names: list = None
+    ingredient_names: list = None,
+    commit: bool = True
 ) -> Recipe:
-    """Remove want to try ingredients from an existing recipe."""
-    recipe = get_recipe(db, name=name, recipe_id=recipe_id)
-    if not recipe:
-        raise ValueError(f"Recipe not found")
-    
-    if not ingredient_names:
-        return recipe
+    """Remove want to try ingredients from an existing recipe.
     
-    ingredients_to_remove = []
-    for ingredient_name in ingredient_names:
-        normalized_name, _ = normalize_name(ingredient_name)
-        ingredient_obj = get_ingredient(db, name=normalized_name)
-        if ingredient_obj and ingredient_obj in recipe.want_to_try_ingredients:
-            ingredients_to_remove.append(ingredient_obj)
-    
-    if ingredients_to_remove:
-        for ingredient in ingredients_to_remove:
-            recipe.want_to_try_ingredients.remove(ingredient)
-    
-    db.commit()
-    db.refresh(recipe)
-    return recipe
+    Pass commit=False to leave the DELETE uncommitted, so callers changing
+    several links at once can commit once at the end.
+    """
+    return _remove_listed_ingredients(db, 'want_to_try_ingredients', recipe_id, name, ingredient_names, commit=commit)
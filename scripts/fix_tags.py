@@ -7,8 +7,10 @@ from pathlib import Path
 # Add scripts to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+from sqlalchemy import select, delete, literal
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from database import SessionLocal
-from models import Tag, Recipe, Ingredient, Article
+from models import Tag, Recipe, Ingredient, Article, recipe_tags, article_tags
 
 
 def merge_tags(db, source_tag_name: str, target_tag_name: str):
@@ -26,23 +28,19 @@ def merge_tags(db, source_tag_name: str, target_tag_name: str):
         db.add(target_tag)
         db.flush()
     
-    # Transfer recipes
-    for recipe in list(source_tag.recipes):
-        if target_tag not in recipe.tags:
-            recipe.tags.append(target_tag)
-        recipe.tags.remove(source_tag)
-    
-    # Transfer ingredients
-    for ingredient in list(source_tag.ingredients):
-        if target_tag not in ingredient.tags:
-            ingredient.tags.append(target_tag)
-        ingredient.tags.remove(source_tag)
-    
-    # Transfer articles
-    for article in list(source_tag.articles):
-        if target_tag not in article.tags:
-            article.tags.append(target_tag)
-        article.tags.remove(source_tag)
+    # Transfer recipes and articles: one INSERT ... SELECT per junction table re-points every link
+    # (links the target already has are skipped by ON CONFLICT), then one DELETE drops the source links.
+    # Ingredients no longer have tags, so there is nothing to transfer for them
+    for table, owner_column in ((recipe_tags, 'recipe_id'), (article_tags, 'article_id')):
+        db.execute(
+            sqlite_insert(table)
+            .from_select(
+                [owner_column, 'tag_id'],
+                select(table.c[owner_column], literal(target_tag.id)).where(table.c.tag_id == source_tag.id)
+            )
+            .on_conflict_do_nothing()
+        )
+        db.execute(delete(table).where(table.c.tag_id == source_tag.id))
     
     # Delete source tag
     db.delete(source_tag)
@@ -57,17 +55,14 @@ def remove_tag(db, tag_name: str):
         print(f"  Warning: Tag '{tag_name}' not found")
         return
     
-    # Remove from recipes
-    for recipe in list(tag.recipes):
-        recipe.tags.remove(tag)
-    
-    # Remove from ingredients
-    for ingredient in list(tag.ingredients):
-        ingredient.tags.remove(tag)
-    
-    # Remove from articles
-    for article in list(tag.articles):
-        article.tags.remove(tag)
+    # Remove from recipes and articles with one DELETE per junction table instead of
+    # unlinking each owner through its collection. Pending ORM deletes (e.g. articles
+    # removed just before) are flushed first so they don't go looking for rows that are gone.
+    # Ingredients no longer have tags
+    db.flush()
+    for table in (recipe_tags, article_tags):
+        db.execute(delete(table).where(table.c.tag_id == tag.id))
+    db.expire(tag, ['recipes', 'articles'])
     
     # Delete tag
     db.delete(tag)
@@ -192,7 +192,10 @@ def export_recipe_to_json(recipe_id: int) -> Path:
     """Export a recipe to a JSON file. Returns the path to the JSON file."""
     db = SessionLocal()
     try:
-        recipe = get_recipe(db, recipe_id=recipe_id)
+        # Every collection is exported, so load them all up front
+        recipe = get_recipe(db, recipe_id=recipe_id, load=(
+            'ingredients', 'tags', 'secondary_ingredients', 'clashing_ingredients', 'want_to_try_ingredients'
+        ))
         if not recipe:
             raise ValueError(f"Recipe with ID {recipe_id} not found")
         
@@ -224,11 +227,21 @@ def import_recipe_from_json(recipe_id: int) -> Recipe:
         if not json_data:
             raise ValueError("JSON file is empty or invalid")
         
-        # Get the recipe
-        recipe = get_recipe(db, recipe_id=recipe_id)
+        # Get the recipe; every collection is diffed against the JSON below, so load them all up front
+        recipe = get_recipe(db, recipe_id=recipe_id, load=(
+            'ingredients', 'tags', 'secondary_ingredients', 'clashing_ingredients', 'want_to_try_ingredients'
+        ))
         if not recipe:
             raise ValueError(f"Recipe with ID {recipe_id} not found in database")
         
+        # Snapshot every collection before the mutators below run: they expire what they
+        # change, and with debug.strict_loading on an expired collection can't be reloaded
+        current_tag_names = {tag.name for tag in recipe.tags}
+        current_ingredient_names = {ing.name for ing in recipe.ingredients}
+        current_secondary_names = {ing.name for ing in recipe.secondary_ingredients}
+        current_clashing_names = {ing.name for ing in recipe.clashing_ingredients}
+        current_want_to_try_names = {ing.name for ing in recipe.want_to_try_ingredients}
+        
         # Convert JSON to recipe data (with spell checking)
         recipe_data, corrections = json_to_recipe_data(json_data)
         
@@ -247,37 +260,37 @@ def import_recipe_from_json(recipe_id: int) -> Recipe:
             for original, corrected in all_corrections:
                 print(f"    '{original}' → '{corrected}'")
         
+        # The field, tag and ingredient changes below are committed together at the end
         recipe = update_recipe(
             db,
             recipe_id=recipe_id,
             new_name=recipe_data['name'] if new_name_normalized != current_name_normalized else None,
             instructions=recipe_data['instructions'],
-            notes=recipe_data['notes']
+            notes=recipe_data['notes'],
+            commit=False
         )
         
         # Update tags - remove all, then add new ones
-        current_tag_names = {tag.name for tag in recipe.tags}
         new_tag_names = set(recipe_data['tags'])
         
         # Remove tags that are no longer in the list
         tags_to_remove = current_tag_names - new_tag_names
         if tags_to_remove:
-            recipe = remove_tags_from_recipe(db, recipe_id=recipe_id, tag_names=list(tags_to_remove))
+            recipe = remove_tags_from_recipe(db, recipe_id=recipe_id, tag_names=list(tags_to_remove), commit=False)
         
         # Add new tags
         tags_to_add = new_tag_names - current_tag_names
         if tags_to_add:
-            recipe = add_tags_to_recipe(db, recipe_id=recipe_id, tag_names=list(tags_to_add))
+            recipe = add_tags_to_recipe(db, recipe_id=recipe_id, tag_names=list(tags_to_add), commit=False)
         
         # Update ingredients - remove all, then add new ones with quantity/notes
-        current_ingredient_names = {ing.name for ing in recipe.ingredients}
         new_ingredient_names = set(recipe_data['ingredients'])
         ingredient_details_map = {detail['name']: detail for detail in recipe_data.get('ingredient_details', [])}
         
         # Remove ingredients that are no longer in the list
         ingredients_to_remove = current_ingredient_names - new_ingredient_names
         if ingredients_to_remove:
-            recipe = remove_ingredients_from_recipe(db, recipe_id=recipe_id, ingredient_names=list(ingredients_to_remove))
+            recipe = remove_ingredients_from_recipe(db, recipe_id=recipe_id, ingredient_names=list(ingredients_to_remove), commit=False)
         
         # Add new ingredients (create them automatically if they don't exist)
         ingredients_to_add = new_ingredient_names - current_ingredient_names
@@ -287,7 +300,7 @@ def import_recipe_from_json(recipe_id: int) -> Recipe:
                 if not get_ingredient(db, name=ing_name):
                     # Automatically create the ingredient with type "other"
                     # This will fail if "other" type doesn't exist (as intended)
-                    add_ingredient(db, ing_name, "other")
+                    add_ingredient(db, ing_name, "other", commit=False)
             
             # Add ingredients with quantity and notes via association objects
             for ing_name in ingredients_to_add:
@@ -309,8 +322,8 @@ def import_recipe_from_json(recipe_id: int) -> Recipe:
                 )
                 db.add(assoc)
             
-            db.commit()
-            db.refresh(recipe)
+            db.flush()
+            db.expire(recipe, ['ingredient_associations'])
         
         # Update quantity/notes for existing ingredients that are still in the recipe
         for ing_name in new_ingredient_names & current_ingredient_names:
@@ -325,59 +338,56 @@ def import_recipe_from_json(recipe_id: int) -> Recipe:
                         if ing_detail.get('notes') is not None:
                             assoc.notes = ing_detail['notes']
         
-        db.commit()
-        db.refresh(recipe)
-        
         # Update secondary_ingredients - remove all, then add new ones
         from db_operations import add_secondary_ingredients_to_recipe, remove_secondary_ingredients_from_recipe
-        current_secondary_names = {ing.name for ing in recipe.secondary_ingredients}
         new_secondary_names = set(recipe_data.get('secondary_ingredients', []))
         
         secondary_to_remove = current_secondary_names - new_secondary_names
         if secondary_to_remove:
-            recipe = remove_secondary_ingredients_from_recipe(db, recipe_id=recipe_id, ingredient_names=list(secondary_to_remove))
+            recipe = remove_secondary_ingredients_from_recipe(db, recipe_id=recipe_id, ingredient_names=list(secondary_to_remove), commit=False)
         
         secondary_to_add = new_secondary_names - current_secondary_names
         if secondary_to_add:
             # Create any missing ingredients automatically with default type "other"
             for ing_name in secondary_to_add:
                 if not get_ingredient(db, name=ing_name):
-                    add_ingredient(db, ing_name, "other")
-            recipe = add_secondary_ingredients_to_recipe(db, recipe_id=recipe_id, ingredient_names=list(secondary_to_add))
+                    add_ingredient(db, ing_name, "other", commit=False)
+            recipe = add_secondary_ingredients_to_recipe(db, recipe_id=recipe_id, ingredient_names=list(secondary_to_add), commit=False)
         
         # Update clashing_ingredients - remove all, then add new ones
         from db_operations import add_clashing_ingredients_to_recipe, remove_clashing_ingredients_from_recipe
-        current_clashing_names = {ing.name for ing in recipe.clashing_ingredients}
         new_clashing_names = set(recipe_data.get('clashing_ingredients', []))
         
         clashing_to_remove = current_clashing_names - new_clashing_names
         if clashing_to_remove:
-            recipe = remove_clashing_ingredients_from_recipe(db, recipe_id=recipe_id, ingredient_names=list(clashing_to_remove))
+            recipe = remove_clashing_ingredients_from_recipe(db, recipe_id=recipe_id, ingredient_names=list(clashing_to_remove), commit=False)
         
         clashing_to_add = new_clashing_names - current_clashing_names
         if clashing_to_add:
             # Create any missing ingredients automatically with default type "other"
             for ing_name in clashing_to_add:
                 if not get_ingredient(db, name=ing_name):
-                    add_ingredient(db, ing_name, "other")
-            recipe = add_clashing_ingredients_to_recipe(db, recipe_id=recipe_id, ingredient_names=list(clashing_to_add))
+                    add_ingredient(db, ing_name, "other", commit=False)
+            recipe = add_clashing_ingredients_to_recipe(db, recipe_id=recipe_id, ingredient_names=list(clashing_to_add), commit=False)
         
         # Update want_to_try_ingredients - remove all, then add new ones
         from db_operations import add_want_to_try_ingredients_to_recipe, remove_want_to_try_ingredients_from_recipe
-        current_want_to_try_names = {ing.name for ing in recipe.want_to_try_ingredients}
         new_want_to_try_names = set(recipe_data.get('want_to_try', []))
         
         want_to_try_to_remove = current_want_to_try_names - new_want_to_try_names
         if want_to_try_to_remove:
-            recipe = remove_want_to_try_ingredients_from_recipe(db, recipe_id=recipe_id, ingredient_names=list(want_to_try_to_remove))
+            recipe = remove_want_to_try_ingredients_from_recipe(db, recipe_id=recipe_id, ingredient_names=list(want_to_try_to_remove), commit=False)
         
         want_to_try_to_add = new_want_to_try_names - current_want_to_try_names
         if want_to_try_to_add:
             # Create any missing ingredients automatically with default type "other"
             for ing_name in want_to_try_to_add:
                 if not get_ingredient(db, name=ing_name):
-                    add_ingredient(db, ing_name, "other")
-            recipe = add_want_to_try_ingredients_to_recipe(db, recipe_id=recipe_id, ingredient_names=list(want_to_try_to_add))
+                    add_ingredient(db, ing_name, "other", commit=False)
+            recipe = add_want_to_try_ingredients_to_recipe(db, recipe_id=recipe_id, ingredient_names=list(want_to_try_to_add), commit=False)
+        
+        db.commit()
+        db.refresh(recipe)
         
         # Delete the JSON file after successful import
         json_path.unlink()
@@ -568,6 +578,9 @@ def import_ingredient_from_json(ingredient_id: int) -> Ingredient:
         
         # Removed tag handling - ingredients no longer have tags
         
+        # Load attributes before the session closes - the caller reads them afterwards
+        db.refresh(ingredient)
+        
         # Delete the JSON file after successful import
         json_path.unlink()
         
@@ -820,6 +833,9 @@ def import_new_article_from_json(json_path: Path = None) -> Article:
             # Preserve JSON file on database errors
             raise ValueError(f"Failed to add article to database: {e}. JSON file preserved for editing.")
         
+        # Load attributes before the session closes - the caller reads them afterwards
+        db.refresh(article)
+        
         # Only delete JSON file after successful import
         json_path.unlink()
         return article
@@ -1191,6 +1207,9 @@ def import_tag_from_json(tag_id: int) -> Tag:
             new_subtag_name=tag_data['subtag'] if subtag_changed else ...
         )
         
+        # Load attributes before the session closes - the caller reads them afterwards
+        db.refresh(updated_tag)
+        
         # Delete the JSON file after successful import
         json_path.unlink()
         
@@ -57,7 +57,7 @@ class RecipeIngredient(Base):
     __tablename__ = 'recipe_ingredients'
     
     recipe_id = Column(Integer, ForeignKey('recipes.id'), primary_key=True)
-    ingredient_id = Column(Integer, ForeignKey('ingredients.id'), primary_key=True)
+    ingredient_id = Column(Integer, ForeignKey('ingredients.id'), primary_key=True, index=True)  # Indexed for ingredient -> recipes lookups
     quantity = Column(String(100))  # e.g., "2 cups", "1 lb", "to taste"
     notes = Column(Text)  # Optional notes about this ingredient in this recipe
     
@@ -71,7 +71,7 @@ class Recipe(Base):
     __tablename__ = 'recipes'
     
     id = Column(Integer, primary_key=True)
-    name = Column(String(200), nullable=False)
+    name = Column(String(200), nullable=False, index=True)  # Indexed for get_recipe(name=...) lookups
     instructions = Column(Text)
     notes = Column(Text)  # General notes about the recipe
     
@@ -163,7 +163,7 @@ class Ingredient(Base):
     notes = Column(Text)  # General notes about the ingredient
     
     # Many-to-one relationship: many ingredients belong to one type (nullable - can be typeless)
-    type_id = Column(Integer, ForeignKey('ingredient_types.id'), nullable=True)
+    type_id = Column(Integer, ForeignKey('ingredient_types.id'), nullable=True, index=True)
     type = relationship('IngredientType', back_populates='ingredients')
     
     # Many-to-many relationship with Recipes (via association object)
@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""
+Query-count test for the cookbook database system.
+Runs the recipe link mutators with small and large inputs and checks that the number of
+SQL statements they emit stays the same, so per-item SELECTs (N+1 patterns) can't creep back in.
+Also checks that a no-op recipe update neither writes nor commits, and imports a JSON recipe edit with debug.strict_loading on, so a hidden lazy load raises.
+"""
+import json
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+# Add scripts directory to path
+scripts_dir = Path(__file__).parent / 'scripts'
+if str(scripts_dir) not in sys.path:
+    sys.path.insert(0, str(scripts_dir))
+
+from sqlalchemy import event
+import db_operations
+from database import SessionLocal, engine
+from json_editor import export_recipe_to_json, import_recipe_from_json
+from db_operations import (
+    add_recipe, get_recipe, update_recipe, delete_recipe, list_ingredients, list_tags, get_ingredient, delete_ingredient,
+    get_or_create_ingredient_type,
+    add_tags_to_recipe, remove_tags_from_recipe,
+    add_ingredients_to_recipe, remove_ingredients_from_recipe,
+    add_secondary_ingredients_to_recipe, remove_secondary_ingredients_from_recipe,
+    add_clashing_ingredients_to_recipe, remove_clashing_ingredients_from_recipe,
+    add_want_to_try_ingredients_to_recipe, remove_want_to_try_ingredients_from_recipe
+)
+
+TEST_RECIPE_NAME = "Query Count Test Recipe"
+STRICT_RECIPE_NAME = "Query Count Strict Import Recipe"
+# Not in the database beforehand, so the import creates it mid-way
+STRICT_NEW_INGREDIENT = "query count strict new ingredient"
+
+# Upper bounds per call, independent of how many names are passed
+MAX_STATEMENTS = {
+    'add_tags_to_recipe': 3,                          # recipe, requested tags not yet linked, INSERT
+    'remove_tags_from_recipe': 2,                     # recipe, DELETE (names resolved in a subquery)
+    'add_ingredients_to_recipe': 3,                   # recipe, requested ingredients not yet linked, INSERT
+    'remove_ingredients_from_recipe': 2,              # recipe, DELETE (names resolved in a subquery)
+    'add_secondary_ingredients_to_recipe': 4,         # recipe, its list, requested ingredients, INSERT
+    'remove_secondary_ingredients_from_recipe': 2,    # recipe, DELETE (names resolved in a subquery)
+    'add_clashing_ingredients_to_recipe': 4,          # recipe, its list, requested ingredients, INSERT
+    'remove_clashing_ingredients_from_recipe': 2,     # recipe, DELETE (names resolved in a subquery)
+    'add_want_to_try_ingredients_to_recipe': 4,       # recipe, its list, requested ingredients, INSERT
+    'remove_want_to_try_ingredients_from_recipe': 2,  # recipe, DELETE (names resolved in a subquery)
+    'update_recipe (no-op)': 2,                       # UPDATE matching no row, recipe
+}
+
+
+@contextmanager
+def count_queries():
+    """Collect every SQL statement the engine sends while the block runs."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, 'before_cursor_execute', before_cursor_execute)
+
+
+@contextmanager
+def count_commits():
+    """Collect every COMMIT the engine sends while the block runs."""
+    commits = []
+
+    def on_commit(conn):
+        commits.append(conn)
+
+    event.listen(engine, 'commit', on_commit)
+    try:
+        yield commits
+    finally:
+        event.remove(engine, 'commit', on_commit)
+
+
+def run_counted(label, func, *args, **kwargs):
+    """Run one mutator in a fresh session and return how many statements it emitted."""
+    db = SessionLocal()
+    try:
+        with count_queries() as statements:
+            func(db, *args, **kwargs)
+        print(f"  {label}: {len(statements)} statement(s)")
+        return len(statements)
+    finally:
+        db.close()
+
+
+def check_constant(name, small_count, large_count):
+    """Check a mutator stayed within its bound and didn't grow with the input size."""
+    ok = True
+    if large_count != small_count:
+        print(f"  ✗ {name}: {small_count} statement(s) for the small input but {large_count} for the large one")
+        ok = False
+    if max(small_count, large_count) > MAX_STATEMENTS[name]:
+        print(f"  ✗ {name}: more than {MAX_STATEMENTS[name]} statement(s)")
+        ok = False
+    if ok:
+        print(f"  ✓ {name}: constant at {small_count} statement(s)")
+    return ok
+
+
+def test_query_counts():
+    """Main query-count test function."""
+    print("="*70)
+    print("QUERY COUNT TEST: Recipe link mutators")
+    print("="*70)
+
+    db = SessionLocal()
+    try:
+        existing_recipe = get_recipe(db, name=TEST_RECIPE_NAME)
+        if existing_recipe:
+            delete_recipe(db, recipe_id=existing_recipe.id)
+
+        ingredient_names = [ing.name for ing in list_ingredients(db)]
+        tag_names = [tag.name for tag in list_tags(db)]
+        if len(ingredient_names) < 10 or len(tag_names) < 8:
+            print("✗ Error: Need at least 10 ingredients and 8 tags in database. Run bootload.py first.")
+            return False
+
+        recipe = add_recipe(db, name=TEST_RECIPE_NAME, ingredients=ingredient_names[:2])
+        recipe_id = recipe.id
+    finally:
+        db.close()
+
+    results = []
+    try:
+        for name, func, keyword, small, large in [
+            ('add_tags_to_recipe', add_tags_to_recipe, 'tag_names', tag_names[:2], tag_names[2:8]),
+            ('remove_tags_from_recipe', remove_tags_from_recipe, 'tag_names', tag_names[:2], tag_names[2:8]),
+            ('add_ingredients_to_recipe', add_ingredients_to_recipe, 'ingredient_names',
+             ingredient_names[2:4], ingredient_names[4:10]),
+            ('remove_ingredients_from_recipe', remove_ingredients_from_recipe, 'ingredient_names',
+             ingredient_names[2:4], ingredient_names[4:10]),
+            ('add_secondary_ingredients_to_recipe', add_secondary_ingredients_to_recipe, 'ingredient_names',
+             ingredient_names[2:4], ingredient_names[4:10]),
+            ('remove_secondary_ingredients_from_recipe', remove_secondary_ingredients_from_recipe, 'ingredient_names',
+             ingredient_names[2:4], ingredient_names[4:10]),
+            ('add_clashing_ingredients_to_recipe', add_clashing_ingredients_to_recipe, 'ingredient_names',
+             ingredient_names[2:4], ingredient_names[4:10]),
+            ('remove_clashing_ingredients_from_recipe', remove_clashing_ingredients_from_recipe, 'ingredient_names',
+             ingredient_names[2:4], ingredient_names[4:10]),
+            ('add_want_to_try_ingredients_to_recipe', add_want_to_try_ingredients_to_recipe, 'ingredient_names',
+             ingredient_names[2:4], ingredient_names[4:10]),
+            ('remove_want_to_try_ingredients_from_recipe', remove_want_to_try_ingredients_from_recipe,
+             'ingredient_names', ingredient_names[2:4], ingredient_names[4:10]),
+        ]:
+            print(f"\n{name}:")
+            small_count = run_counted(f"{len(small)} name(s)", func, recipe_id=recipe_id, **{keyword: small})
+            large_count = run_counted(f"{len(large)} name(s)", func, recipe_id=recipe_id, **{keyword: large})
+            results.append(check_constant(name, small_count, large_count))
+    except Exception as e:
+        print(f"\n✗ ERROR during query count test: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+    finally:
+        db = SessionLocal()
+        try:
+            delete_recipe(db, recipe_id=recipe_id)
+        finally:
+            db.close()
+
+    return all(results)
+
+
+def test_noop_update():
+    """Re-save a recipe's notes unchanged and check nothing is written or committed."""
+    print("\n" + "="*70)
+    print("QUERY COUNT TEST: No-op recipe update")
+    print("="*70)
+
+    name = 'update_recipe (no-op)'
+    db = SessionLocal()
+    try:
+        existing_recipe = get_recipe(db, name=TEST_RECIPE_NAME)
+        if existing_recipe:
+            delete_recipe(db, recipe_id=existing_recipe.id)
+        recipe_id = add_recipe(db, name=TEST_RECIPE_NAME, notes="unchanged notes").id
+    finally:
+        db.close()
+
+    db = SessionLocal()
+    try:
+        with count_queries() as statements, count_commits() as commits:
+            update_recipe(db, recipe_id=recipe_id, notes="unchanged notes")
+    finally:
+        db.close()
+        db = SessionLocal()
+        try:
+            delete_recipe(db, recipe_id=recipe_id)
+        finally:
+            db.close()
+
+    print(f"  {len(statements)} statement(s), {len(commits)} commit(s)")
+    ok = True
+    if len(statements) > MAX_STATEMENTS[name]:
+        print(f"  ✗ {name}: more than {MAX_STATEMENTS[name]} statement(s)")
+        ok = False
+    if commits:
+        print(f"  ✗ {name}: committed although nothing changed")
+        ok = False
+    if ok:
+        print(f"  ✓ {name}: no write committed")
+    return ok
+
+
+@contextmanager
+def strict_loading():
+    """Turn on debug.strict_loading for the block, so any relationship lazy load raises."""
+    previous = db_operations._STRICT_LOADING
+    db_operations._STRICT_LOADING = True
+    try:
+        yield
+    finally:
+        db_operations._STRICT_LOADING = previous
+
+
+def test_strict_import():
+    """Import a JSON edit touching every recipe collection with strict loading on."""
+    print("\n" + "="*70)
+    print("STRICT LOADING TEST: JSON recipe import")
+    print("="*70)
+
+    db = SessionLocal()
+    try:
+        existing_recipe = get_recipe(db, name=STRICT_RECIPE_NAME)
+        if existing_recipe:
+            delete_recipe(db, recipe_id=existing_recipe.id)
+        if get_ingredient(db, name=STRICT_NEW_INGREDIENT):
+            delete_ingredient(db, name=STRICT_NEW_INGREDIENT)
+        # The import files new ingredients under "other"
+        get_or_create_ingredient_type(db, "other")
+
+        ingredient_names = [ing.name for ing in list_ingredients(db)]
+        tag_names = [tag.name for tag in list_tags(db)]
+        if len(ingredient_names) < 10 or len(tag_names) < 2:
+            print("✗ Error: Need at least 10 ingredients and 2 tags in database. Run bootload.py first.")
+            return False
+
+        recipe = add_recipe(db, name=STRICT_RECIPE_NAME, ingredients=ingredient_names[:2], tags=tag_names[:1])
+        recipe_id = recipe.id
+    finally:
+        db.close()
+
+    expected = {
+        'tags': sorted(tag_names[1:2]),
+        'ingredients': sorted(ingredient_names[1:3]),
+        'secondary_ingredients': sorted(ingredient_names[3:5]),
+        'clashing_ingredients': sorted(ingredient_names[5:6]),
+        'want_to_try_ingredients': sorted(ingredient_names[6:8]),
+    }
+    try:
+        with strict_loading():
+            # Two rounds: the second replaces lists the first one filled
+            for round_names in (ingredient_names[8:10] + [STRICT_NEW_INGREDIENT], None):
+                json_path = export_recipe_to_json(recipe_id)
+                with open(json_path, 'r', encoding='utf-8') as f:
+                    json_data = json.load(f)
+                if round_names:
+                    json_data['secondary_ingredients'] = round_names
+                    json_data['clashing_ingredients'] = round_names
+                    json_data['want_to_try'] = round_names
+                else:
+                    json_data['tags'] = expected['tags']
+                    json_data['ingredients'] = expected['ingredients']
+                    json_data['secondary_ingredients'] = expected['secondary_ingredients']
+                    json_data['clashing_ingredients'] = expected['clashing_ingredients']
+                    json_data['want_to_try'] = expected['want_to_try_ingredients']
+                with open(json_path, 'w', encoding='utf-8') as f:
+                    json.dump(json_data, f)
+                import_recipe_from_json(recipe_id)
+
+            db = SessionLocal()
+            try:
+                recipe = get_recipe(db, recipe_id=recipe_id, load=tuple(expected))
+                actual = {
+                    'tags': sorted(tag.name for tag in recipe.tags),
+                    'ingredients': sorted(ing.name for ing in recipe.ingredients),
+                    'secondary_ingredients': sorted(ing.name for ing in recipe.secondary_ingredients),
+                    'clashing_ingredients': sorted(ing.name for ing in recipe.clashing_ingredients),
+                    'want_to_try_ingredients': sorted(ing.name for ing in recipe.want_to_try_ingredients),
+                }
+            finally:
+                db.close()
+    except Exception as e:
+        print(f"\n✗ ERROR during strict import: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+    finally:
+        db = SessionLocal()
+        try:
+            delete_recipe(db, recipe_id=recipe_id)
+            if get_ingredient(db, name=STRICT_NEW_INGREDIENT):
+                delete_ingredient(db, name=STRICT_NEW_INGREDIENT)
+        finally:
+            db.close()
+
+    if actual != expected:
+        for field in expected:
+            if actual[field] != expected[field]:
+                print(f"  ✗ {field}: expected {expected[field]}, got {actual[field]}")
+        return False
+    print("  ✓ import ran without lazy loads and wrote every collection")
+    return True
+
+
+if __name__ == '__main__':
+    success = test_query_counts()
+    success = test_noop_update() and success
+    success = test_strict_import() and success
+    print("\n" + "="*70)
+    if success:
+        print("QUERY COUNT TEST: PASSED ✓")
+    else:
+        print("QUERY COUNT TEST: FAILED ✗")
+    print("="*70)
+    sys.exit(0 if success else 1)